@@ -9,10 +9,28 @@ A decorator is used to apply styles from an external file.
 from PyQt5.QtWidgets import (
     QVBoxLayout, QFrame, QHBoxLayout, QWidget
 )
+from PyQt5.QtCore import pyqtSignal
 from .properties import STYLEPATH, STYLETCOLOR
 from ...modules.Style import Style
 
 
+class _Backdrop(QFrame):
+    """
+    Overlay placed behind a Dialog that emits `clicked` when pressed.
+    """
+
+    clicked = pyqtSignal()
+
+    def mousePressEvent(self, event) -> None:
+        """
+        Emits the clicked signal.
+
+        Args:
+            event (QMouseEvent): The mouse event.
+        """
+        self.clicked.emit()
+
+
 @Style(STYLEPATH, True)
 class Dialog(QFrame):
     """
@@ -43,28 +61,49 @@ class Dialog(QFrame):
 
         super().__init__(parent)
 
-        self.setObjectName(STYLETCOLOR[color]['floatingDialog'])
+        self.setObjectName(STYLETCOLOR[color].floatingDialog)
         
-        self.backdrop = QFrame(parent)
+        self.backdrop = _Backdrop(parent)
         self.backdrop.setStyleSheet(backdrop)
         self.backdrop.setGeometry(0, 0, parent.width(), parent.height())
 
         self.backdrop.hide()
 
-        self.backdrop.mousePressEvent = self.close
+        self.backdrop.clicked.connect(self.close)
+
+        # The backdrop belongs to the parent, so it is deleted together with the dialog
+        self.destroyed.connect(self.backdrop.deleteLater)
 
         self.childrenLayout = children
         self.fixedSize = fixedSize
 
         self.setFixedSize(*self.fixedSize)
 
-        self.mainLayout = QVBoxLayout(self)
+        # The main layout is created when first needed. A vertical children layout
+        # is used as the main layout directly instead of being nested in another one.
+        self.mainLayout = None
 
-        if self.childrenLayout is not None:
-            self.mainLayout.addLayout(self.childrenLayout)
+        if isinstance(self.childrenLayout, QVBoxLayout):
+            self.mainLayout = self.childrenLayout
+            self.setLayout(self.mainLayout)
+        elif self.childrenLayout is not None:
+            self._ensureLayout().addLayout(self.childrenLayout)
 
         self.hide()
     
+    def _ensureLayout(self) -> QVBoxLayout:
+        """
+        Returns the main layout of the dialog, creating it if it does not exist yet.
+
+        Returns:
+            QVBoxLayout: The main layout of the dialog.
+        """
+
+        if self.mainLayout is None:
+            self.mainLayout = QVBoxLayout(self)
+
+        return self.mainLayout
+
     def addWidget(self, widget: QWidget) -> None:
         """
         Adds a widget to the dialog.
@@ -73,15 +112,18 @@ class Dialog(QFrame):
             widget (QWidget): The widget to add to the dialog.
         """
 
-        self.mainLayout.addWidget(widget)
+        self._ensureLayout().addWidget(widget)
 
     def show(self) -> None:
         """
         Displays the dialog, centering it relative to its parent.
         """
 
-        if self.parent():
-            w, h = self.parent().width(), self.parent().height()
+        parent = self.parent()
+
+        if parent:
+            size = parent.size()
+            w, h = size.width(), size.height()
             self.move((w - self.width()) // 2, (h - self.height()) // 2)
             self.backdrop.setGeometry(0, 0, w, h)
 
@@ -90,8 +132,7 @@ class Dialog(QFrame):
         self.raise_()
         super().show()
 
-    # Close uses event, but doesn't need it
-    def close(self, event=None) -> None:
+    def close(self) -> None:
         """
         Closes the dialog and hides the backdrop.
         """
@@ -4,18 +4,22 @@ This file contains the constants and properties for the Dialog object in this mo
 Modifying any property in this file requires making the same changes in related files.
 """
 
-# Location of the file with the styles for the Notify object
-STYLEPATH = "Qurderer/components/dialog/Dialog.css"
+import os
+from typing import NamedTuple
+
+# Location of the file with the styles for the Dialog object
+STYLEPATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "Dialog.css")
 """Path to the file containing the styles for the Dialog object."""
 
+class ColorStyle(NamedTuple):
+    """Object names of the Dialog widgets for one color style."""
+
+    floatingDialog: str
+
 # Object names for each style
 STYLETCOLOR = {
-    "black": {
-        "floatingDialog": "black-floatingDialog",
-    },
-    "white": {
-        "floatingDialog": "white-floatingDialog",
-    },
+    "black": ColorStyle(floatingDialog="black-floatingDialog"),
+    "white": ColorStyle(floatingDialog="white-floatingDialog"),
 }
 """
 Dictionary defining object names for each style.
@@ -5,9 +5,13 @@ The class handles displaying messages with custom icons, progress bars, and pred
 A decorator is used to apply styles from an external file.
 """
 
+import weakref
+from functools import partial
+
 from PyQt5.QtWidgets import QLabel, QVBoxLayout, QWidget, QProgressBar, QHBoxLayout, QFrame
 from PyQt5.QtGui import QPixmap
-from PyQt5.QtCore import Qt, QTimer
+from PyQt5.QtCore import Qt, QTimer, QPropertyAnimation
+from PyQt5 import sip
 
 # Decorator for applying styles to PyQt5 widgets
 from ...modules.Style import *
@@ -16,7 +20,7 @@ from ...modules.Style import *
 from ...modules.Icon import *
 
 # Importing style properties and configuration
-from .properties import STYLEBAR, STYLEPATH, STYLETCOLOR, ICONS
+from .properties import STYLEPATH, STYLENAMES, ICONS
 
 
 @Style(STYLEPATH, True)
@@ -29,8 +33,22 @@ class Notify(QWidget):
     indicating the notification duration.
     """
 
-    cont = {}
-    """Dictionary tracking the number of notifications per parent window."""
+    cont = weakref.WeakKeyDictionary()
+    """
+    Dictionary tracking the number of notifications per parent window.
+
+    Parents are held weakly so closed windows are dropped. Notifications without a parent
+    are counted under the Notify class itself.
+    """
+
+    _live = []
+    """Notifications currently displayed and updated by the shared driver timer."""
+
+    _driver = None
+    """Single QTimer that updates the position of every live notification."""
+
+    _pending = []
+    """Notifications waiting to be shown on the next event loop pass."""
 
     def __init__(
             self, 
@@ -59,43 +77,44 @@ class Notify(QWidget):
         super().__init__(parent)
         self.parent = parent
         self.duration = duration
-        self.elapsedTime = 0
         self.message = message
+        self.characterLimit = characterLimit
 
         self.msRenderTime = 16
 
-        if len(message) > characterLimit:
-            self.message = message[:characterLimit - 1] + '...'
+        # Notifications over the limit are dropped before any widget is built
+        self._countKey = self.parent if self.parent is not None else Notify
+        self.notificationCount = Notify.cont.get(self._countKey, 0) + 1
+        self.dropped = self.notificationCount > notificationsLimit
+
+        if self.dropped:
+            self.deleteLater()
+            return
+
+        Notify.cont[self._countKey] = self.notificationCount
 
         self.setWindowFlags(Qt.FramelessWindowHint | Qt.Tool)
         self.setAttribute(Qt.WA_TranslucentBackground)
+        self.setAttribute(Qt.WA_DeleteOnClose)
 
         self.container = QFrame(self)
         self.container.setMinimumWidth(270)
 
-        if color in STYLETCOLOR:
-            self.containerStyle = STYLETCOLOR[color]['QFrame']
+        self.containerStyle, labelStyle, self.progressBarStyle = STYLENAMES[(color, type)]
 
         self.container.setObjectName(self.containerStyle)
 
         self.iconLabel = QLabel(self.container)
 
-        if type in ICONS:
-            self.icon = ICONS[type]()
-
-        if customIcon is not None:
-            self.icon = customIcon
+        self.icon = customIcon if customIcon is not None else ICONS[type]()
 
         self.iconLabel.setPixmap(self.icon)
 
         self.messageLabel = QLabel(self.message, self.container)
-        self.messageLabel.setObjectName(STYLETCOLOR[color]['QLabel'])
+        self.messageLabel.setObjectName(labelStyle)
 
         self.progressBar = QProgressBar(self.container)
 
-        if type in STYLEBAR:
-            self.progressBarStyle = STYLEBAR[type]
-
         self.progressBar.setObjectName(self.progressBarStyle)
 
         self.progressBar.setFixedHeight(10)
@@ -115,17 +134,6 @@ class Notify(QWidget):
         self.containerLayout.setContentsMargins(20, 10, 20, 10)
 
         self.container.setLayout(self.containerLayout)
-        self.container.adjustSize()
-
-        if self.parent in Notify.cont:
-            Notify.cont[self.parent] += 1
-        else:
-            Notify.cont[self.parent] = 1
-
-        self.notificationCount = Notify.cont[self.parent]
-
-        if self.notificationCount > notificationsLimit:
-            return
 
         self.mainLayout = QVBoxLayout(self)
         self.mainLayout.addWidget(self.container)
@@ -133,39 +141,134 @@ class Notify(QWidget):
         self.setLayout(self.mainLayout)
         self.adjustSize()
 
-        self.updatePosition()
+        # The progress bar is animated by Qt and closes the notification when it ends
+        self.progressAnimation = QPropertyAnimation(self.progressBar, b'value', self)
+        self.progressAnimation.setStartValue(0)
+        self.progressAnimation.setEndValue(self.duration)
+        self.progressAnimation.setDuration(self.duration)
+        self.progressAnimation.finished.connect(self.close)
+        self.progressAnimation.start()
+
+        # Position is updated by a timer shared by all notifications
+        Notify._live.append(self)
+
+        # Notifications deleted by Qt (e.g. with their parent) never reach close()
+        self.destroyed.connect(partial(Notify._forget, self))
+
+        if Notify._driver is None:
+            Notify._driver = QTimer()
+            Notify._driver.timeout.connect(Notify._tick)
+
+        if not Notify._driver.isActive():
+            Notify._driver.start(self.msRenderTime) # Approximately 60 fps
+
+        # Showing is deferred so a burst of notifications is shown in one event loop pass
+        Notify._pending.append(self)
+
+        if len(Notify._pending) == 1:
+            QTimer.singleShot(0, Notify._flushShow)
+
+    @staticmethod
+    def _flushShow() -> None:
+        """Positions and shows every notification created since the last flush."""
+        pending = Notify._pending
+        Notify._pending = []
+
+        for notify in pending:
+            # A notification may already be closed before it was shown
+            if notify in Notify._live and not Notify._dropIfDeleted(notify):
+                notify.elideMessage()
+                notify.updatePosition()
+                notify.show()
+
+    @staticmethod
+    def _tick() -> None:
+        """Updates every live notification and stops the driver when none are left."""
+        for notify in list(Notify._live):
+            if not Notify._dropIfDeleted(notify):
+                notify.updatePosition()
+
+        if not Notify._live:
+            Notify._driver.stop()
+
+    @staticmethod
+    def _forget(notify: 'Notify') -> bool:
+        """
+        Removes a notification from the live list and releases its place in the count.
 
-        # Dynamic update of notifications position
-        self.positionTimer = QTimer(self)
-        self.positionTimer.timeout.connect(self.updatePosition)
-        self.positionTimer.start(self.msRenderTime) # Approximately 60 fps
+        Args:
+            notify (Notify): The notification to remove.
 
-        self.timer = QTimer(self)
-        self.timer.timeout.connect(self.updateProgress)
-        self.timer.start(self.msRenderTime) # Approximately 60 fps
+        Returns:
+            bool: Whether the notification was live.
+        """
+        try:
+            Notify._live.remove(notify)
+        except ValueError:
+            return False
 
-        QTimer.singleShot(duration, self.close)
+        if Notify.cont.get(notify._countKey, 0) > 0:
+            Notify.cont[notify._countKey] -= 1
 
-        self.show()
+        return True
+
+    @staticmethod
+    def _dropIfDeleted(notify: 'Notify') -> bool:
+        """
+        Forgets a notification whose widget or parent window has been deleted.
+
+        Args:
+            notify (Notify): The notification to check.
+
+        Returns:
+            bool: Whether the notification was dropped.
+        """
+        if sip.isdeleted(notify):
+            Notify._forget(notify)
+            return True
+
+        if notify.parent is not None and sip.isdeleted(notify.parent):
+            Notify._forget(notify)
+            notify.deleteLater()
+            return True
+
+        return False
+
+    def elideMessage(self) -> None:
+        """
+        Elides a long message by width, to about `characterLimit` average characters.
+
+        The label is measured with its polished font, so this runs once the stylesheet
+        is applied, right before the notification is shown.
+        """
+        if len(self.message) <= self.characterLimit:
+            return
+
+        self.messageLabel.ensurePolished()
+        metrics = self.messageLabel.fontMetrics()
+
+        self.message = metrics.elidedText(self.message, Qt.ElideRight, self.characterLimit * metrics.averageCharWidth())
+        self.messageLabel.setText(self.message)
+        self.adjustSize()
 
     def updatePosition(self) -> None:
         """Updates the notification's position relative to its parent window."""
         if self.parent:
-            x = self.parent.x() + self.parent.width() - self.width() - 20
-            y = self.parent.y() + 40 + (self.notificationCount - 1) * 80
+            pos = self.parent.pos()
+            x = pos.x() + self.parent.width() - self.width() - 20
+            y = pos.y() + 40 + (self.notificationCount - 1) * 80
             self.move(x, y)
 
-    def updateProgress(self) -> None:
-        """Updates the progress bar and closes the notification when the duration ends."""
-        self.elapsedTime += 30  
-        self.progressBar.setValue(self.elapsedTime)
+    def close(self) -> None:
+        """
+        Closes the notification and updates the notification count.
+
+        The notification is deleted once closed, so closing it again does nothing.
+        """
+        if not Notify._forget(self):
+            return
 
-        if self.elapsedTime >= self.duration:
-            self.timer.stop()
-            self.close()
+        # A notification closed early must not keep its expiry animation running
+        self.progressAnimation.stop()
 
-    def close(self) -> None:
-        """Closes the notification and updates the notification count."""
-        if self.parent in Notify.cont and Notify.cont[self.parent] > 0:
-            Notify.cont[self.parent] -= 1
         super().close()
@@ -4,18 +4,29 @@ This file contains the constants and properties for the Notify object in this mo
 Modifying any property in this file requires making the same changes in related files.
 """
 
+import os
+from typing import NamedTuple
+
 # Import a class to create Pixmap icons easily
 from ...modules import Icon
 
+# Directory of this module, so resources do not depend on the working directory
+DIRECTORY = os.path.dirname(os.path.abspath(__file__))
+"""Absolute path to the directory containing the Notify resources."""
+
 # Location of the file with the styles for the Notify object
-STYLEPATH = "Qurderer/components/notify/Notify.css"
+STYLEPATH = os.path.join(DIRECTORY, "Notify.css")
 """Path to the file containing the styles for the Notify object."""
 
+# Location of the default icons of the Notify object
+ICONSPATH = os.path.join(DIRECTORY, "icons")
+"""Path to the directory containing the default icons for the Notify object."""
+
 # References to create the default icons of the Notify class
 ICONS = {
-    "success": lambda: Icon("Qurderer/components/notify/icons/check.png", 25, 25),
-    "error": lambda: Icon("Qurderer/components/notify/icons/close.png", 25, 25),
-    "info": lambda: Icon("Qurderer/components/notify/icons/information.png", 25, 25),
+    "success": lambda: Icon(os.path.join(ICONSPATH, "check.png"), 25, 25),
+    "error": lambda: Icon(os.path.join(ICONSPATH, "close.png"), 25, 25),
+    "info": lambda: Icon(os.path.join(ICONSPATH, "information.png"), 25, 25),
 }
 """
 Dictionary mapping notification types to their default icons.
@@ -26,16 +37,16 @@ Available types:
 - **info** → Blue information icon.
 """
 
+class ColorStyle(NamedTuple):
+    """Object names of the Notify widgets for one color style."""
+
+    QFrame: str
+    QLabel: str
+
 # Object names for each style
 STYLETCOLOR = {
-    "black": {
-        "QFrame": "black-QFrame",
-        "QLabel": "white-QLabel",
-    },
-    "white": {
-        "QFrame": "white-QFrame",
-        "QLabel": "black-QLabel",
-    },
+    "black": ColorStyle(QFrame="black-QFrame", QLabel="white-QLabel"),
+    "white": ColorStyle(QFrame="white-QFrame", QLabel="black-QLabel"),
 }
 """
 Dictionary defining object names for each style.
@@ -59,3 +70,15 @@ Available types:
 - **error** → Red progress bar.
 - **info** → Blue progress bar.
 """
+
+# Object names of every (color, type) combination, resolved once at import
+STYLENAMES = {
+    (color, type): (STYLETCOLOR[color].QFrame, STYLETCOLOR[color].QLabel, STYLEBAR[type])
+    for color in STYLETCOLOR
+    for type in STYLEBAR
+}
+"""
+Dictionary mapping a (color, type) pair to the object names used by the Notify class.
+
+Each value is a tuple of (QFrame object name, QLabel object name, QProgressBar object name).
+"""
@@ -6,7 +6,7 @@ It supports color customization and state querying.
 """
 
 from PyQt5.QtWidgets import QWidget
-from PyQt5.QtCore import Qt, QPropertyAnimation, pyqtProperty
+from PyQt5.QtCore import Qt, QPropertyAnimation, QRect, pyqtProperty
 from PyQt5.QtGui import QColor, QPainter, QBrush
 
 class ToggleSwitch(QWidget):
@@ -50,6 +50,15 @@ class ToggleSwitch(QWidget):
         self._bg_color_off = QColor(bgColor[0])
         self._circle_color = QColor(circleColor)
 
+        # The size is fixed, so brushes and geometry are computed once
+        self._brush_on = QBrush(self._bg_color_on)
+        self._brush_off = QBrush(self._bg_color_off)
+        self._brush_circle = QBrush(self._circle_color)
+        self._end_on = width - height + 2
+        self._end_off = 2
+        self._radius = height / 2
+        self._circle_diameter = height - 4
+
         self.setChecked(checked)
 
         self.setCursor(Qt.PointingHandCursor)
@@ -71,7 +80,7 @@ class ToggleSwitch(QWidget):
         Performs the circle sliding animation based on the current state.
         """
         start = self._circle_position
-        end = self.width() - self.height() + 2 if self._checked else 2
+        end = self._end_on if self._checked else self._end_off
         self._animation.stop()
         self._animation.setStartValue(start)
         self._animation.setEndValue(end)
@@ -87,13 +96,12 @@ class ToggleSwitch(QWidget):
         painter = QPainter(self)
         painter.setRenderHint(QPainter.Antialiasing)
 
-        bg_color = self._bg_color_on if self._checked else self._bg_color_off
-        painter.setBrush(QBrush(bg_color))
+        painter.setBrush(self._brush_on if self._checked else self._brush_off)
         painter.setPen(Qt.NoPen)
-        painter.drawRoundedRect(0, 0, self.width(), self.height(), self.height() / 2, self.height() / 2)
+        painter.drawRoundedRect(0, 0, self.width(), self.height(), self._radius, self._radius)
 
-        painter.setBrush(QBrush(self._circle_color))
-        painter.drawEllipse(self._circle_position, 2, self.height() - 4, self.height() - 4)
+        painter.setBrush(self._brush_circle)
+        painter.drawEllipse(self._circle_position, 2, self._circle_diameter, self._circle_diameter)
 
     def isChecked(self):
         """
@@ -124,10 +132,19 @@ class ToggleSwitch(QWidget):
         """
         Updates the X position of the circle (used by the animation).
 
+        Only the area covered by the old and new circle is repainted, since the
+        background does not change while the circle slides.
+
         Args:
             pos (int): The new position.
         """
+        # The animation can emit the same integer position more than once
+        if pos == self._circle_position:
+            return
+
+        old = QRect(self._circle_position, 2, self._circle_diameter, self._circle_diameter)
         self._circle_position = pos
-        self.update()
+        new = QRect(pos, 2, self._circle_diameter, self._circle_diameter)
+        self.update(old.united(new).adjusted(-1, -1, 1, 1))
 
     circlePosition = pyqtProperty(int, fget=getCirclePosition, fset=setCirclePosition)
@@ -2,11 +2,12 @@
 This module defines the Icon class, which extends QPixmap to handle image loading and scaling.
 
 The class ensures that an image is loaded only if the file exists. If the file does not exist, 
-it initializes an empty QPixmap.
+it initializes an empty QPixmap. Scaled images are kept in the QPixmapCache, so repeated icons
+share the same pixmap data instead of being decoded and scaled again.
 """
 
 import os
-from PyQt5.QtGui import QPixmap
+from PyQt5.QtGui import QPixmap, QPixmapCache
 from PyQt5.QtCore import Qt
 
 class Icon(QPixmap):
@@ -27,8 +28,14 @@ class Icon(QPixmap):
             w (int): The desired width of the icon.
             h (int): The desired height of the icon.
         """
-        if os.path.exists(path):
+        key = f'{path}:{w}x{h}'
+        pixmap = QPixmapCache.find(key)
+
+        if pixmap is None and os.path.exists(path):
             pixmap = QPixmap(path).scaled(w, h, Qt.KeepAspectRatio, Qt.SmoothTransformation)
+            QPixmapCache.insert(key, pixmap)
+
+        if pixmap is not None:
             super().__init__(pixmap)
         else:
             super().__init__()
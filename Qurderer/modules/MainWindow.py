@@ -7,16 +7,19 @@ functionality to manage a stack of screens, add new screens, and create and mana
 windows for each screen.
 """
 
+from collections import deque
 from PyQt5.QtWidgets import QWidget, QStackedWidget, QMainWindow
 from PyQt5.QtGui import QIcon
 from PyQt5.QtCore import QTimer, Qt
+from ..utils.hooks import addInitHook
 
 def MainWindow(
         title: str, 
         geometry: list[int], 
-        icon: QIcon, 
+        icon: QIcon | None = None, 
         resizable: bool = True, 
-        maximizable: bool = True
+        maximizable: bool = True,
+        historySize: int = 64
     ):
     """
     A decorator that adds window management functionality to a class.
@@ -28,9 +31,10 @@ def MainWindow(
     Args:
         title (str): The title to set for the window.
         geometry (list): The window geometry as a list [x, y, width, height].
-        icon (QIcon): The icon to set for the window.
+        icon (QIcon, optional): The icon to set for the window. Defaults to None, which keeps the default icon.
         resizable (bool, optional): Determines whether the window can be resized. Defaults to True.
         maximizable (bool, optional): Determines whether the window can be maximized. Defaults to True.
+        historySize (int, optional): The number of screens kept in the back history. Defaults to 64.
     
     Returns:
         decorator: A class decorator that adds window management functionality to the class.
@@ -40,43 +44,45 @@ def MainWindow(
         """
         Decorates a class to add window management functionality.
         """
+        # The fixed size only depends on the decorator arguments
+        fixedWidth, fixedHeight = geometry[-2:]
 
-        originalInit = cls.__init__
-
-        def newInit(self, *args, **kwargs):
+        def initMainWindow(self):
             """
-            Initializes the decorated class with window settings and stacked screens.
+            Configures the initialized instance with window settings and stacked screens.
 
             Sets the window title, geometry, and icon, and initializes the stacked widget
             to manage multiple screens.
-
-            Args:
-                *args: Positional arguments passed to the original class initializer.
-                **kwargs: Keyword arguments passed to the original class initializer.
             """
-            originalInit(self, *args, **kwargs)
-
             self.setWindowTitle(title)
             self.setGeometry(*geometry)
-            self.setWindowIcon(icon)
+            if icon is not None:
+                self.setWindowIcon(icon)
 
             if not resizable:
-                ah, aw = self.windowGeometry[-2:]
-                self.setFixedSize(ah, aw)
-                self.setWindowFlags(Qt.WindowMinimizeButtonHint | Qt.WindowCloseButtonHint)
-            
-            if not maximizable:
+                self.setFixedSize(fixedWidth, fixedHeight)
+
+            # Window flags are set at most once, each call recreates the native window
+            if not resizable or not maximizable:
                 self.setWindowFlags(Qt.WindowMinimizeButtonHint | Qt.WindowCloseButtonHint)
 
-            self.screenHistory = []  # Stores the history of screens navigated back to.
+            self.screenHistory = deque(maxlen=historySize)  # Stores the history of screens navigated back to.
 
             self.stackedScreens = QStackedWidget()
             self.setCentralWidget(self.stackedScreens)
 
-            for _, value in cls.screens.items():
-                self.stackedScreens.addWidget(value)
+            # Screens are added in one pass without intermediate repaints or signals
+            self.stackedScreens.setUpdatesEnabled(False)
+            self.stackedScreens.blockSignals(True)
+
+            try:
+                for screen in cls.screens.values():
+                    self.stackedScreens.addWidget(screen)
+            finally:
+                self.stackedScreens.blockSignals(False)
+                self.stackedScreens.setUpdatesEnabled(True)
 
-        cls.__init__ = newInit
+        addInitHook(cls, initMainWindow)
 
         @staticmethod
         def addScreen(screen: QWidget):
@@ -12,13 +12,15 @@ a slight delay in UI updates as it processes the event in the next event loop cy
 
 from PyQt5.QtWidgets import QWidget
 from PyQt5.QtCore import QTimer
+from PyQt5 import sip
+from ..utils.hooks import addInitHook
 
 def Screen(name: str, autoreloadUI: bool = False):
     """
     A decorator that adds a `name` attribute and showEvent method to a screen class.
 
     This decorator assigns a unique `name` to a screen class. The `name` is set as 
-    both an instance attribute (`self.name`) and a class-level attribute (`screenName`).
+    class-level attributes (`name` and `screenName`), which instances read through the class.
     It also ensures that `showEvent` is added to execute the reloadUI method when the 
     screen is displayed. If `autoreloadUI` is enabled, it ensures that the UI method
     is properly called upon screen display.
@@ -29,7 +31,7 @@ def Screen(name: str, autoreloadUI: bool = False):
 
     Returns:
         decorator: A class decorator that adds the following to the decorated class:
-            - `name` attribute: The screen name as an instance attribute
+            - `name` attribute: The screen name as a class attribute
             - `screenName` attribute: The screen name as a class attribute
             - `reloadUI()` method: Reloads the user interface
             - `setScreenName(name)` method: Changes the screen name
@@ -46,46 +48,58 @@ def Screen(name: str, autoreloadUI: bool = False):
         Returns:
             cls: The decorated class with a `name` attribute and UI reload support.
         """
-        originalInit = cls.__init__
+        # The UI method is validated once, at decoration time
+        hasUI = callable(getattr(cls, 'UI', None))
 
-        if autoreloadUI:
-            # Check if the class has a UI method
-            if not hasattr(cls, 'UI') or not callable(getattr(cls, 'UI')):
-                raise TypeError(f'The class {cls.__name__} must have a UI() method')
+        if autoreloadUI and not hasUI:
+            raise TypeError(f'The class {cls.__name__} must have a UI() method')
 
-        def newInit(self, *args, **kwargs):
+        def checkWidgetParent(self):
             """
-            Initializes the decorated class and assigns the `name` attribute.
-
-            Args:
-                *args: Positional arguments passed to the original class initializer.
-                **kwargs: Keyword arguments passed to the original class initializer.
+            Checks that the initialized instance has a `widgetParent` attribute.
             """
-            self.name = name
-            originalInit(self, *args, **kwargs)
-
-            # Check if the class has a widgetParent
-            if autoreloadUI and not hasattr(self, 'widgetParent'):
+            if not hasattr(self, 'widgetParent'):
                 raise TypeError(f'The class {cls.__name__} must have a widgetParent attribute')
         
         def removeAllLayouts(widget: QWidget):
             """
-            Recursively removes all layouts and widgets from a given QWidget.
+            Removes all layouts and widgets from a given QWidget.
+
+            Nested layouts are walked with an explicit stack instead of recursion. Each
+            layout is deleted immediately once it has been emptied, since taking a nested
+            layout out of its parent detaches it, and the top-level one is gone before a
+            new layout is set on the widget.
 
             Args:
                 widget (QWidget): The widget from which all layouts and child widgets will be removed.
             """
             layout = widget.layout()
-            
-            if layout is not None:
-                while layout.count():
-                    item = layout.takeAt(0)
-                    if item.widget():
-                        item.widget().setParent(None)
-                    if item.layout():
-                        removeAllLayouts(item.layout())
-
-            layout.deleteLater()
+
+            if layout is None:
+                return
+
+            stack = [layout]
+
+            while stack:
+                current = stack.pop()
+                takeAt = current.takeAt
+
+                # Items are taken from the end, which does not shift the remaining ones
+                for index in range(current.count() - 1, -1, -1):
+                    item = takeAt(index)
+                    child = item.widget()
+
+                    if child is not None:
+                        child.setParent(None)
+                        child.deleteLater()
+
+                    childLayout = item.layout()
+
+                    if childLayout is not None:
+                        stack.append(childLayout)
+
+                # Detached layouts have no owner left, so each one is deleted here
+                sip.delete(current)
         
         def reloadUI(self):
             """
@@ -96,13 +110,28 @@ def Screen(name: str, autoreloadUI: bool = False):
             may introduce a slight delay in UI updates as it processes the event
             in the next event loop cycle.
             """
-            if not hasattr(self, 'widgetParent'):
+            # Screens with autoreloadUI are checked for widgetParent after initialization
+            if not autoreloadUI and not hasattr(self, 'widgetParent'):
                 raise TypeError(f'The class {cls.__name__} must have a widgetParent attribute')
-            if not hasattr(cls, 'UI') or not callable(getattr(cls, 'UI')):
+            if not hasUI:
                 raise TypeError(f'The class {cls.__name__} must have a UI() method')
             
             removeAllLayouts(self)
-            QTimer.singleShot(0, lambda: self.UI(self.widgetParent))
+            QTimer.singleShot(0, self._loadUI)
+
+        def loadUI(self):
+            """
+            Executes the UI method with the widget parent.
+
+            Painting is suspended while the UI is rebuilt, so the screen repaints once
+            with the finished layout instead of after every widget is added.
+            """
+            self.setUpdatesEnabled(False)
+
+            try:
+                self.UI(self.widgetParent)
+            finally:
+                self.setUpdatesEnabled(True)
         
         def setScreenName(self, name: str) -> None:
             """
@@ -120,19 +149,37 @@ def Screen(name: str, autoreloadUI: bool = False):
             self.name = name
             cls.screenName = name
 
-        cls.__init__ = newInit
+        if autoreloadUI:
+            addInitHook(cls, checkWidgetParent)
+
+        # The name is known at decoration time, instances read it through the class
+        cls.name = name
         cls.screenName = name
         cls.reloadUI = reloadUI
+        cls._loadUI = loadUI
         cls.setScreenName = setScreenName
 
         if autoreloadUI:
             originalShowEvent = getattr(cls, 'showEvent', QWidget.showEvent)
 
+            def runPendingReload(self):
+                """
+                Runs the reload scheduled by showEvent.
+                """
+                self._reloadPending = False
+                reloadUI(self)
+
             def showEvent(self, event):
-                # Reload the UI after a short delay. Note: This line cost me 5 hours of debugging.
-                QTimer.singleShot(0, lambda: reloadUI(self))
+                # Several shows within one event loop pass share a single pending reload
+                if not getattr(self, '_reloadPending', False):
+                    self._reloadPending = True
+
+                    # Reload the UI after a short delay. Note: This line cost me 5 hours of debugging.
+                    QTimer.singleShot(0, self._runPendingReload)
+
                 originalShowEvent(self, event)
 
+            cls._runPendingReload = runPendingReload
             cls.showEvent = showEvent
 
         return cls
@@ -1,20 +1,51 @@
 """
 This module defines a decorator for applying stylesheets to PyQt5 widgets or windows.
 
-The `Style` decorator is used to apply a style to a widget or window either from a file path 
-or directly as a string. It modifies the `__init__` method of the decorated class to include 
-the stylesheet application.
+The `Style` decorator is used to apply a style to a widget or window either from a file path
+or directly as a string. It registers an initialization hook on the decorated class that
+applies the stylesheet.
+
+Stylesheet files are read once and cached by path and modification time, so every instance
+of a decorated class reuses the same string instead of reading the file again.
 """
 
+import os
 from ..utils.files import GenericFile
+from ..utils.hooks import addInitHook
+
+_CSS_CACHE: dict[str, tuple[float, str]] = {}
+"""Stylesheet contents by file path, stored with the modification time they were read at."""
+
+def _readStyleSheet(style: str) -> str:
+    """
+    Reads the stylesheet from a file, reusing the cached content while the file is unchanged.
+
+    Args:
+        style (str): The file path to the stylesheet.
+
+    Returns:
+        str: The content of the stylesheet file.
+    """
+    try:
+        mtime = os.path.getmtime(style)
+    except OSError:
+        # Let GenericFile raise its own error for a missing file
+        return GenericFile(style).readFile()
+
+    cached = _CSS_CACHE.get(style)
+
+    if cached is None or cached[0] != mtime:
+        cached = _CSS_CACHE[style] = (mtime, GenericFile(style).readFile())
+
+    return cached[1]
 
 def Style(style: str, path: bool = False):
     """
     A decorator that applies a stylesheet to a widget or window.
 
-    This decorator either applies a style from a file path or directly as a string to 
-    the widget or window that the decorator is applied to. If `path` is set to `True`, 
-    the `style` is treated as a file path, and the stylesheet is read from the file. 
+    This decorator either applies a style from a file path or directly as a string to
+    the widget or window that the decorator is applied to. If `path` is set to `True`,
+    the `style` is treated as a file path, and the stylesheet is read from the file.
     Otherwise, the `style` is applied directly as a string.
 
     Args:
@@ -35,41 +66,23 @@ def Style(style: str, path: bool = False):
         Returns:
             cls: The decorated class with the stylesheet applied.
         """
-        originalInit = cls.__init__
+        # Resolved once, so every spelling of the same file shares one cache entry
+        stylePath = os.path.abspath(style) if path else None
 
-        def newInit(self, *args, **kwargs):
+        def applyStyle(self):
             """
-            Initializes the decorated class and applies the stylesheet.
-
-            Args:
-                *args: Positional arguments passed to the original class initializer.
-                **kwargs: Keyword arguments passed to the original class initializer.
-            """
-            originalInit(self, *args, **kwargs)
-
-            if path:
-                styleSheet = readStyleSheet(style)
+            Applies the stylesheet after the instance is initialized.
 
-            self.setStyleSheet(styleSheet if path else style)
-
-        cls.__init__ = newInit
-
-        @staticmethod
-        def readStyleSheet(style: str) -> str:
+            Instances flagged as `dropped` (e.g. notifications over the limit) are deleted
+            without being shown, so parsing and polishing their stylesheet is skipped.
             """
-            Reads the stylesheet from a file.
+            if getattr(self, 'dropped', False):
+                return
 
-            This method reads the content of the given file and returns it as a string.
-            It uses the GenericFile utility class to read the file content.
+            self.setStyleSheet(_readStyleSheet(stylePath) if path else style)
 
-            Args:
-                style (str): The file path to the stylesheet.
-
-            Returns:
-                str: The content of the stylesheet file.
-            """
-            return GenericFile(style).readFile()
+        addInitHook(cls, applyStyle)
 
         return cls
-    
+
     return decorator
@@ -6,15 +6,18 @@ The decorator initializes window properties and screen management attributes bef
 the original __init__ method to ensure all required attributes are available when needed.
 """
 
+from collections import deque
 from PyQt5.QtGui import QIcon
 from PyQt5.QtWidgets import QStackedWidget, QWidget
+from ..utils.hooks import addInitHook
 
 def Window(
         name: str, 
         title: str, 
         geometry: list[int], 
-        icon: QIcon, 
-        resizable: bool = True
+        icon: QIcon | None = None, 
+        resizable: bool = True,
+        historySize: int = 64
     ):
     """
     A decorator that assigns window properties and screen management capabilities to a class.
@@ -26,8 +29,9 @@ def Window(
         name (str): The name of the window.
         title (str): The title of the window.
         geometry (list): The geometry of the window (ax: int, ay: int, aw: int, ah: int).
-        icon (QIcon): The icon of the window.
+        icon (QIcon, optional): The icon of the window. Defaults to None, which keeps the default icon.
         resizable (bool, optional): The ability to resize the window. Defaults to True.
+        historySize (int, optional): The number of screens kept in the back history. Defaults to 64.
     
     Returns:
         function: A decorator that adds the following to the decorated class:
@@ -48,42 +52,32 @@ def Window(
         Returns:
             type: The decorated class with window properties and screen management.
         """
-        originalInit = cls.__init__
+        # The fixed size only depends on the decorator arguments
+        fixedWidth, fixedHeight = geometry[-2:]
 
-        def newInit(self, *args, **kwargs):
+        def initWindow(self):
             """
-            Initializes the decorated class with window settings and screen management.
-
-            This method initializes window properties and screen management attributes
-            before calling the original __init__ method to ensure all required attributes
-            are available when needed.
-
-            Args:
-                *args: Positional arguments passed to the original class initializer.
-                **kwargs: Keyword arguments passed to the original class initializer.
+            Initializes screen management attributes before the original __init__
+            method, so they are available when needed.
             """
-            # Initialize window properties first
-            self.name = name
-            self.title = title
-            self.windowGeometry = geometry
-            
             # Initialize screen management
-            self.screenHistory = []
+            self.screenHistory = deque(maxlen=historySize)
             self.screens = {}  # Initialize screens dictionary
+            self._screenIndex = {}  # Index of each screen in the stacked widget
             self.stackedScreens = QStackedWidget()  # Initialize stacked widget
-            
-            # Initialize parent class
-            originalInit(self, *args, **kwargs)
-            
-            # Configure window
+
+        def configureWindow(self):
+            """
+            Configures the window after the original __init__ method.
+            """
             self.setWindowTitle(self.title)
             self.setGeometry(*self.windowGeometry)
 
             if not resizable:
-                ah, aw = geometry[-2:]
-                self.setFixedSize(ah, aw)
+                self.setFixedSize(fixedWidth, fixedHeight)
 
-            self.setWindowIcon(icon)
+            if icon is not None:
+                self.setWindowIcon(icon)
             self.setCentralWidget(self.stackedScreens)  # Set central widget
 
         def addScreen(self, screen: QWidget):
@@ -104,7 +98,7 @@ def Window(
             
             name = screen.screenName
             self.screens[name] = screen
-            self.stackedScreens.addWidget(screen)
+            self._screenIndex[name] = self.stackedScreens.addWidget(screen)
 
         def setScreen(self, name: str) -> None:
             """
@@ -119,26 +113,28 @@ def Window(
             Raises:
                 Exception: If the specified screen does not exist.
             """
-            if name in self.screens:
-                currentScreen = self.stackedScreens.currentWidget()
-                if currentScreen:
-                    self.screenHistory.append(currentScreen)
-
-                screen = self.screens[name]
-                if not hasattr(screen, 'screenName'):
-                    raise Exception(f'The screen {screen} does not have screenName attribute.')
-                
-                self.stackedScreens.setCurrentWidget(screen)      
-            else:
+            # Screens are validated by addScreen, so a single index lookup is enough here
+            index = self._screenIndex.get(name)
+
+            if index is None:
                 raise Exception(f'The screen window does not exist {name}.')
+
+            stackedScreens = self.stackedScreens
+
+            # History stores indexes, so going back does not search the stacked widget
+            currentIndex = stackedScreens.currentIndex()
+            if currentIndex != -1:
+                self.screenHistory.append(currentIndex)
+
+            stackedScreens.setCurrentIndex(index)
             
         def goBack(self) -> None:
             """
             Navigates back to the previous screen in the screen history.
             """
             if self.screenHistory:
-                previousScreen = self.screenHistory.pop()
-                self.stackedScreens.setCurrentWidget(previousScreen)
+                previousIndex = self.screenHistory.pop()
+                self.stackedScreens.setCurrentIndex(previousIndex)
         
         def setWindowName(self, name: str) -> None:
             """
@@ -155,8 +151,14 @@ def Window(
             
             self.name = name
 
-        # Asignar el método __init__ a la clase
-        cls.__init__ = newInit
+        # Window properties are shared class attributes; setWindowName overrides per instance
+        cls.name = name
+        cls.title = title
+        cls.windowGeometry = tuple(geometry)
+
+        # Register the window initialization hooks
+        addInitHook(cls, initWindow, before=True)
+        addInitHook(cls, configureWindow)
 
         # Add instance methods
         cls.addScreen = addScreen
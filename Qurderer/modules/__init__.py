@@ -2,6 +2,6 @@ from .MainWindow import *
 from .Screen import *
 from .Window import *
 from .Style import *
-from .UseConfig import *
+from .useConfig import *
 from .Icon import *
-from .UseSessionStorage import *
\ No newline at end of file
+from .useSessionStorage import *
\ No newline at end of file
@@ -2,7 +2,7 @@
 This module defines a decorator for injecting a configuration object into a class.
 
 The `UseConfig` decorator adds a `Config` attribute to a class, making the provided 
-configuration available within the class. The configuration is passed during initialization 
+configuration available within the class. The configuration is set on the class itself 
 and is accessible through the `Config` attribute.
 """
 
@@ -30,21 +30,7 @@ def UseConfig(config: object):
         Returns:
             cls: The decorated class with the `Config` attribute.
         """
-        originalInit = cls.__init__
-
-        def newInit(self, *args, **kwargs):
-            """
-            Initializes the decorated class and adds the configuration.
-
-            Args:
-                *args: Positional arguments passed to the original class initializer.
-                **kwargs: Keyword arguments passed to the original class initializer.
-            """
-            originalInit(self, *args, **kwargs)
-            self.Config = config
-
-        cls.__init__ = newInit
-
+        # Instances read the configuration through the class, no per-instance copy is needed
         cls.Config = config
 
         return cls
@@ -7,22 +7,31 @@ items from a session. The `UseSessionStorage` decorator adds a `SessionStorage`
 attribute to a class, which allows easy access to the session storage.
 """
 
-from dataclasses import dataclass
-
-@dataclass
 class SessionStorage:
     """
     A class that simulates session storage in memory.
 
     This class provides methods for storing, retrieving, and removing key-value pairs
-    in memory, which mimics a session storage mechanism. The storage is global across
-    all instances of the application.
+    in memory, which mimics a session storage mechanism. Each instance owns its own
+    storage; the module-level `sessionStorage` instance is the one shared across the
+    application.
+
+    Thread safety: `getItem`, `setItem` and `removeItem` each perform a single dict
+    operation, which CPython executes atomically under the GIL, so they can be called
+    from several threads without a lock. Sequences of calls (e.g. read, modify, then
+    write back) are not atomic and need a lock of their own.
 
     Attributes:
         _storage (dict): A dictionary to store session data.
     """
-    
-    _storage = {}
+
+    __slots__ = ('_storage',)
+
+    def __init__(self) -> None:
+        """
+        Initializes an empty SessionStorage.
+        """
+        self._storage = {}
 
     def getItem(self, item: str):
         """
@@ -45,7 +54,7 @@ class SessionStorage:
             value: The value to associate with the given key.
         """
         self._storage[name] = value
-    
+
     def removeItem(self, item: str) -> None:
         """
         Removes an item from the session storage.
@@ -79,21 +88,7 @@ def UseSessionStorage():
         Returns:
             cls: The decorated class with the `SessionStorage` attribute.
         """
-        originalInit = cls.__init__
-
-        def newInit(self, *args, **kwargs):
-            """
-            Initializes the decorated class and adds session storage.
-
-            Args:
-                *args: Positional arguments passed to the original class initializer.
-                **kwargs: Keyword arguments passed to the original class initializer.
-            """
-            originalInit(self, *args, **kwargs)
-            self.SessionStorage = sessionStorage
-
-        cls.__init__ = newInit
-
+        # Instances read the storage through the class, no per-instance copy is needed
         cls.SessionStorage = sessionStorage
 
         return cls
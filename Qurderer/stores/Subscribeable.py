@@ -3,9 +3,10 @@ Subscribeable module provides a base class for implementing the Observer pattern
 This module is part of the Qurderer framework and is used for state management and reactivity.
 """
 
-from typing import Any, Callable, List, Optional
+from typing import Any, Callable, Optional
+from .callbacks import Observable
 
-class Subscribeable:
+class Subscribeable(Observable):
     """
     A base class that implements the Observer pattern, allowing objects to subscribe to value changes.
     
@@ -15,8 +16,10 @@ class Subscribeable:
     
     Attributes:
         _value (Any): The current value stored in the Subscribeable instance.
-        _callbacks (List[Callable]): List of callback functions to be called when the value changes.
+        _callbacks (Dict[Hashable, Any]): Ordered callbacks by identity key (bound methods held weakly) to be called when the value changes.
     """
+
+    __slots__ = ()
     
     def __init__(self, initialValue: Optional[Any] = None) -> None:
         """
@@ -25,29 +28,7 @@ class Subscribeable:
         Args:
             initialValue (Optional[Any], optional): The initial value. Defaults to None.
         """
-        self._value = initialValue
-        self._callbacks: List[Callable[[Any], None]] = []
-
-    def subscribe(self, callback: Callable[[Any], None]) -> None:
-        """
-        Subscribe a callback function to be called when the value changes.
-        
-        Args:
-            callback (Callable[[Any], None]): The function to be called when the value changes.
-                                             The function should accept one parameter of any type.
-        """
-        if callback not in self._callbacks:
-            self._callbacks.append(callback)
-
-    def unsubscribe(self, callback: Callable[[Any], None]) -> None:
-        """
-        Unsubscribe a previously registered callback function.
-        
-        Args:
-            callback (Callable[[Any], None]): The callback function to remove from subscribers.
-        """
-        if callback in self._callbacks:
-            self._callbacks.remove(callback)
+        super().__init__(initialValue)
 
     @property
     def value(self) -> Any:
@@ -67,17 +48,16 @@ class Subscribeable:
         Args:
             newValue (Any): The new value to set.
         """
-        if newValue != self._value:
-            self._value = newValue
-            self._notify_subscribers()
+        self._setValue(newValue)
 
-    def _notify_subscribers(self) -> None:
+    def update(self, function: Callable[[Any], Any]) -> None:
         """
-        Notify all subscribers of the value change.
-        This method is called internally when the value changes.
+        Replace the value with the result of a function of the current value.
+
+        The new value goes through the same change check as the `value` setter, so
+        subscribers are notified once, and only if the value changed.
+        
+        Args:
+            function (Callable[[Any], Any]): Receives the current value and returns the new one.
         """
-        for callback in self._callbacks:
-            try:
-                callback(self._value)
-            except Exception as e:
-                print(f"Error in subscriber callback: {e}")
\ No newline at end of file
+        self.value = function(self._value)
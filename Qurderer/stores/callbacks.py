@@ -0,0 +1,183 @@
+"""
+callbacks module provides the subscriber bookkeeping and the change check shared by
+Subscribeable and State, through their `Observable` base class.
+This module is part of the Qurderer framework and is used for state management and reactivity.
+
+Subscribers are stored in an insertion-ordered dict, keyed by identity. Bound methods are
+stored as weak references, so subscribing an object's method does not keep the object alive.
+"""
+
+import types
+import weakref
+from typing import Any, Callable, Dict, Hashable
+
+def callbackKey(callback: Callable[[Any], None]) -> Hashable:
+    """
+    Returns the key a callback is stored under.
+
+    Keys are based on identity, never on the callback's own hash or equality: a bound
+    method is keyed by its object's id and its function, so methods of unhashable objects
+    can subscribe and methods of distinct but equal objects stay separate subscriptions.
+
+    Args:
+        callback (Callable[[Any], None]): The subscribed callback.
+
+    Returns:
+        Hashable: The key of the callback in a subscribers dict.
+    """
+    if isinstance(callback, types.MethodType):
+        return (id(callback.__self__), callback.__func__)
+
+    return id(callback)
+
+def callbackReference(callback: Callable[[Any], None]) -> Any:
+    """
+    Returns the reference a callback is stored as.
+
+    Bound methods are stored as weak references. Other callables, such as lambdas, and
+    methods of objects that cannot be weakly referenced (e.g. slotted classes without
+    `__weakref__`) are stored as they are.
+
+    Args:
+        callback (Callable[[Any], None]): The subscribed callback.
+
+    Returns:
+        Any: A `weakref.WeakMethod` for bound methods, otherwise the callback itself.
+    """
+    if isinstance(callback, types.MethodType):
+        try:
+            return weakref.WeakMethod(callback)
+        except TypeError:
+            pass
+
+    return callback
+
+def subscribeCallback(callbacks: Dict[Hashable, Any], callback: Callable[[Any], None]) -> None:
+    """
+    Adds a callback to a subscribers dict, unless it is already subscribed.
+
+    A key left behind by a collected object is replaced, since a new object may reuse its id.
+
+    Args:
+        callbacks (Dict[Hashable, Any]): The subscribers, by `callbackKey`.
+        callback (Callable[[Any], None]): The callback to add.
+    """
+    key = callbackKey(callback)
+    current = callbacks.get(key)
+
+    if current is not None and not (isinstance(current, weakref.WeakMethod) and current() is None):
+        return
+
+    # Popped first, so a replaced subscription moves to the end like a new one
+    callbacks.pop(key, None)
+    callbacks[key] = callbackReference(callback)
+
+def notifyCallbacks(callbacks: Dict[Hashable, Any], value: Any, errorMessage: str) -> None:
+    """
+    Calls every subscribed callback with a value.
+
+    Subscriptions of collected bound methods are removed. A callback raising an exception
+    does not stop the others from being called.
+
+    Args:
+        callbacks (Dict[Hashable, Any]): The subscribers, by `callbackKey`.
+        value (Any): The value passed to every callback.
+        errorMessage (str): The message printed before the exception of a failing callback.
+    """
+    # Iterate over a snapshot so callbacks can subscribe or unsubscribe
+    for key, callback in tuple(callbacks.items()):
+        # Subscriptions of bound methods end when their object is collected
+        if isinstance(callback, weakref.WeakMethod):
+            method = callback()
+
+            if method is None:
+                if callbacks.get(key) is callback:
+                    del callbacks[key]
+                continue
+
+            callback = method
+
+        try:
+            callback(value)
+        except Exception as e:
+            print(f"{errorMessage}: {e}")
+
+class Observable:
+    """
+    The base class of Subscribeable and State: a value with subscribers notified when it changes.
+
+    Attributes:
+        _value (Any): The current value.
+        _callbacks (Dict[Hashable, Any]): Ordered callbacks by identity key (bound methods held weakly) to be called when the value changes.
+        _errorMessage (str): The message printed before the exception of a failing callback.
+    """
+
+    __slots__ = ('_value', '_callbacks', '__weakref__')
+
+    _errorMessage = 'Error in subscriber callback'
+
+    def __init__(self, initialValue: Any) -> None:
+        """
+        Initialize a new Observable instance.
+
+        Args:
+            initialValue (Any): The initial value.
+        """
+        self._value = initialValue
+        self._callbacks: Dict[Hashable, Any] = {}
+
+    def subscribe(self, callback: Callable[[Any], None]) -> None:
+        """
+        Subscribe a callback function to be called when the value changes.
+
+        Bound methods are held weakly: the subscription ends when their object is collected.
+
+        Args:
+            callback (Callable[[Any], None]): The function to be called when the value changes.
+                                             The function should accept one parameter of any type.
+        """
+        subscribeCallback(self._callbacks, callback)
+
+    def unsubscribe(self, callback: Callable[[Any], None]) -> None:
+        """
+        Unsubscribe a previously registered callback function.
+
+        Args:
+            callback (Callable[[Any], None]): The callback function to remove from subscribers.
+        """
+        self._callbacks.pop(callbackKey(callback), None)
+
+    def _setValue(self, newValue: Any) -> None:
+        """
+        Set a new value and notify all subscribers if the value has changed.
+
+        Args:
+            newValue (Any): The new value to set.
+        """
+        # Identity is checked first so replacing a value with itself never runs __eq__
+        if newValue is self._value:
+            return
+
+        # Values whose comparison fails (e.g. arrays) are treated as changed
+        try:
+            if newValue == self._value:
+                self._value = newValue
+                return
+        except Exception:
+            pass
+
+        self._value = newValue
+        self._notify_subscribers()
+
+    def _notify_subscribers(self) -> None:
+        """
+        Notify all subscribers of the value change.
+        This method is called internally when the value changes.
+        """
+        callbacks = self._callbacks
+
+        # Most values have no subscribers, skip building the snapshot for them
+        if not callbacks:
+            return
+
+        notifyCallbacks(callbacks, self._value, self._errorMessage)
@@ -4,9 +4,10 @@ This module is part of the Qurderer framework and implements a simple state mana
 pattern similar to React's useState hook.
 """
 
-from typing import Any, Callable, List, Tuple
+from typing import Any, Callable, NamedTuple
+from .callbacks import Observable
 
-class State:
+class State(Observable):
     """
     A class that implements state management with subscription capabilities.
     
@@ -16,8 +17,12 @@ class State:
     
     Attributes:
         _value (Any): The current state value.
-        _callbacks (List[Callable]): List of callback functions to be called when the state changes.
+        _callbacks (Dict[Hashable, Any]): Ordered callbacks by identity key (bound methods held weakly) to be called when the state changes.
     """
+
+    __slots__ = ()
+
+    _errorMessage = 'Error in state subscriber callback'
     
     def __init__(self, initialValue: Any) -> None:
         """
@@ -26,8 +31,7 @@ class State:
         Args:
             initialValue (Any): The initial state value.
         """
-        self._value = initialValue
-        self._callbacks: List[Callable[[Any], None]] = []
+        super().__init__(initialValue)
 
     def get(self) -> Any:
         """
@@ -45,43 +49,24 @@ class State:
         Args:
             newValue (Any): The new state value to set.
         """
-        if newValue != self._value:
-            self._value = newValue
-            self._notify_subscribers()
+        self._setValue(newValue)
 
-    def subscribe(self, callback: Callable[[Any], None]) -> None:
-        """
-        Subscribe a callback function to be called when the state changes.
-        
-        Args:
-            callback (Callable[[Any], None]): The function to be called when the state changes.
-                                             The function should accept one parameter of any type.
-        """
-        if callback not in self._callbacks:
-            self._callbacks.append(callback)
+class StateHandle(NamedTuple):
+    """
+    The functions returned by useState.
 
-    def unsubscribe(self, callback: Callable[[Any], None]) -> None:
-        """
-        Unsubscribe a previously registered callback function.
-        
-        Args:
-            callback (Callable[[Any], None]): The callback function to remove from subscribers.
-        """
-        if callback in self._callbacks:
-            self._callbacks.remove(callback)
+    It unpacks like a plain tuple, and its fields can also be read by name.
 
-    def _notify_subscribers(self) -> None:
-        """
-        Notify all subscribers of the state change.
-        This method is called internally when the state changes.
-        """
-        for callback in self._callbacks:
-            try:
-                callback(self._value)
-            except Exception as e:
-                print(f"Error in state subscriber callback: {e}")
+    Attributes:
+        get (Callable[[], Any]): Returns the current state value.
+        set (Callable[[Any], None]): Sets a new state value.
+        subscribe (Callable[[Callable[[Any], None]], None]): Subscribes to state changes.
+    """
+    get: Callable[[], Any]
+    set: Callable[[Any], None]
+    subscribe: Callable[[Callable[[Any], None]], None]
 
-def useState(initialValue: Any) -> Tuple[Callable[[], Any], Callable[[Any], None], Callable[[Callable[[Any], None]], None]]:
+def useState(initialValue: Any) -> StateHandle:
     """
     Create a new state with getter, setter, and subscriber functions.
     
@@ -93,11 +78,10 @@ def useState(initialValue: Any) -> Tuple[Callable[[], Any], Callable[[Any], None
         initialValue (Any): The initial state value.
         
     Returns:
-        Tuple[Callable[[], Any], Callable[[Any], None], Callable[[Callable[[Any], None]], None]]:
-            A tuple containing:
-            - A function to get the current state value
-            - A function to set a new state value
-            - A function to subscribe to state changes
+        StateHandle: A named tuple containing:
+            - `get`: A function to get the current state value
+            - `set`: A function to set a new state value
+            - `subscribe`: A function to subscribe to state changes
     """
     state = State(initialValue)
-    return state.get, state.set, state.subscribe
\ No newline at end of file
+    return StateHandle(state.get, state.set, state.subscribe)
\ No newline at end of file
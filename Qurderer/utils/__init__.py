@@ -1 +1,3 @@
-from .files import *
\ No newline at end of file
+from .files import *
+from .hooks import *
+from .timing import *
\ No newline at end of file
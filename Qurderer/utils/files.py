@@ -1,7 +1,97 @@
+import io
 import json
+import mmap
 import os
+import pickle
+import shutil
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Iterable
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import ijson
+except ImportError:
+    ijson = None
+
+try:
+    import zstandard
+except ImportError:
+    zstandard = None
+
+class FileError(Exception):
+    """
+    Raised by JsonFile and GenericFile for the errors they translate into readable messages.
+
+    It subclasses Exception, so existing `except Exception` handlers keep catching it.
+    """
+
+# Error message templates, formatted only when an error is raised
+FILE_NOT_FOUND_ERROR = "Error: File '{}' does not exist."
+PERMISSION_ERROR = "Error: You do not have permissions to write to '{}'."
+MALFORMED_JSON_ERROR = 'Error: File contains malformed JSON.'
+INVALID_DATA_ERROR = 'Error: The data provided is not a valid dictionary.'
+UNKNOWN_TOP_LEVEL_ERROR = "Error: Unknown top-level type '{}', expected 'array' or 'object'."
+MISSING_ZSTANDARD_ERROR = "Error: Reading or writing '{}' requires the zstandard package."
+COMPRESSED_APPEND_ERROR = "Error: '{}' is compressed as a single frame and cannot be appended to."
+
+# Below this size a full parse is cheaper than streaming the file
+STREAM_THRESHOLD = 64 * 1024
+
+# Parsed JSON files by absolute path, as ((mtime, size), pickled data), least recently used first.
+# Pickled snapshots are restored faster than the file is parsed and callers never share objects.
+_JSON_CACHE: OrderedDict[str, tuple[tuple[int, int], bytes]] = OrderedDict()
+JSON_CACHE_SIZE = 128
+
+# readJsonMany reads from several threads, every access to _JSON_CACHE holds this lock.
+# Files are read and parsed outside of it, so the reads still overlap.
+_JSON_CACHE_LOCK = threading.Lock()
+
+# Files with this suffix are stored as zstd-compressed JSON
+COMPRESSED_SUFFIX = '.zst'
+
+def _requireZstandard(filepath: str) -> None:
+    if zstandard is None:
+        raise FileError(MISSING_ZSTANDARD_ERROR.format(filepath))
+
+def _loadJson(text: str):
+    # orjson rejects documents json accepts (NaN, Infinity, integers wider than 64 bits),
+    # those are parsed again by json, which also raises the error for malformed ones
+    if orjson is not None:
+        try:
+            return orjson.loads(text)
+        except orjson.JSONDecodeError:
+            pass
+
+    return json.loads(text)
+
+def _prefixedObjects(data, prefix: str) -> Iterable[dict]:
+    # Follows ijson prefixes on parsed data: dotted keys, where 'item' also stands for every
+    # element of an array. Only objects are yielded, like ijson.kvitems does.
+    nodes = [data]
+
+    for key in prefix.split('.') if prefix else ():
+        matched = []
+
+        for node in nodes:
+            if isinstance(node, dict):
+                if key in node:
+                    matched.append(node[key])
+            elif isinstance(node, list) and key == 'item':
+                matched.extend(node)
+
+        nodes = matched
+
+    return (node for node in nodes if isinstance(node, dict))
 
 class JsonFile:
+    __slots__ = ('filepath', 'readType', 'encoding', 'writeType', 'indent')
+
     def __init__(self, filepath) -> None:
         self.filepath: str = filepath
         self.readType: str = 'r'
@@ -11,80 +101,274 @@ class JsonFile:
 
     def readJson(self) -> dict | None:
         try:
-            with open(file=self.filepath, mode=self.readType, encoding=self.encoding) as jsonFile:
-                return json.load(jsonFile)
-        except FileNotFoundError:
-            raise Exception(f"Error: File '{self.filepath}' does not exist.")
-        except json.JSONDecodeError:
-            raise Exception('Error: File contains malformed JSON.')
-        except Exception as e:
-            raise Exception(f'Unexpected error reading file: {e}')
+            key = os.path.abspath(self.filepath)
+            stat = os.stat(key)
+            signature = (stat.st_mtime_ns, stat.st_size)
+
+            with _JSON_CACHE_LOCK:
+                cached = _JSON_CACHE.get(key)
+                hit = cached is not None and cached[0] == signature
+
+                if hit:
+                    _JSON_CACHE.move_to_end(key)
+
+            if hit:
+                return pickle.loads(cached[1])
+
+            if key.endswith(COMPRESSED_SUFFIX):
+                _requireZstandard(self.filepath)
+
+                with open(file=key, mode='rb') as jsonFile:
+                    raw = zstandard.ZstdDecompressor().decompress(jsonFile.read())
+
+                data = _loadJson(raw.decode(self.encoding))
+            else:
+                with open(file=key, mode=self.readType, encoding=self.encoding) as jsonFile:
+                    data = _loadJson(jsonFile.read())
+
+            snapshot = pickle.dumps(data, pickle.HIGHEST_PROTOCOL)
+
+            with _JSON_CACHE_LOCK:
+                _JSON_CACHE[key] = (signature, snapshot)
+
+                while len(_JSON_CACHE) > JSON_CACHE_SIZE:
+                    _JSON_CACHE.popitem(last=False)
+
+            return data
+        except FileNotFoundError as e:
+            raise FileError(FILE_NOT_FOUND_ERROR.format(self.filepath)) from e
+        except json.JSONDecodeError as e:
+            raise FileError(MALFORMED_JSON_ERROR) from e
+
+    @classmethod
+    def readJsonMany(cls, paths: list[str]) -> dict[str, dict | None]:
+        if len(paths) < 2:
+            return {path: cls(path).readJson() for path in paths}
+
+        # File reads release the GIL, so the waits for several files overlap
+        with ThreadPoolExecutor(max_workers=min(len(paths), 8)) as executor:
+            return dict(zip(paths, executor.map(lambda path: cls(path).readJson(), paths)))
 
     def writeJson(self, data: dict) -> bool:
+        # Documents are always encoded by json: orjson output differs in separators,
+        # non-ASCII escaping and NaN handling, so files would change with the installed packages
+        def write(jsonFile) -> None:
+            # json.dump writes every token separately, one buffered write is much cheaper
+            jsonFile.write(json.dumps(data, indent=self.indent))
+
+        return self._write(write)
+
+    def writeJsonStreaming(self, items: Iterable, top: str = 'array') -> bool:
+        # Encodes one element at a time, so the whole document is never held in memory.
+        # Arrays take an iterable of values, objects an iterable of (key, value) pairs.
+        if top not in ('array', 'object'):
+            raise FileError(UNKNOWN_TOP_LEVEL_ERROR.format(top))
+
+        # Bound once, it is called for every element
+        dumps = json.dumps
+
+        def write(jsonFile) -> None:
+            jsonFile.write('[' if top == 'array' else '{')
+            separator = '\n'
+
+            for item in items:
+                jsonFile.write(separator)
+
+                if top == 'array':
+                    jsonFile.write(dumps(item))
+                else:
+                    key, value = item
+                    jsonFile.write(f'{dumps(str(key))}: {dumps(value)}')
+
+                separator = ',\n'
+
+            jsonFile.write('\n]' if top == 'array' else '\n}')
+
+        return self._write(write)
+
+    def _write(self, write: Callable) -> bool:
+        with _JSON_CACHE_LOCK:
+            _JSON_CACHE.pop(os.path.abspath(self.filepath), None)
+
+        # A truncating write ('w', 'w+') goes next to the file and is moved over it, so a
+        # crash never leaves a truncated file behind. Other modes (append, 'x', 'r+') open
+        # the file itself, and so does a write into a directory where no file can be created.
+        # Symlinks are resolved first, so the file they point to is the one replaced.
+        path = os.path.realpath(self.filepath)
+        atomic = self.writeType in ('w', 'w+') and os.access(os.path.dirname(path), os.W_OK)
+        target = f'{path}.{os.getpid()}.{threading.get_ident()}.tmp' if atomic else self.filepath
+
         try:
-            with open(file=self.filepath, mode=self.writeType, encoding=self.encoding) as jsonFile:
-                json.dump(data, jsonFile, indent=self.indent)
+            if self.filepath.endswith(COMPRESSED_SUFFIX):
+                # A second frame would not be read back by readJson
+                if 'a' in self.writeType:
+                    raise FileError(COMPRESSED_APPEND_ERROR.format(self.filepath))
+
+                _requireZstandard(self.filepath)
+
+                # The document is compressed as a single frame, so readers can decompress it in one call
+                buffer = io.StringIO()
+                write(buffer)
+                payload = zstandard.ZstdCompressor(level=3).compress(buffer.getvalue().encode(self.encoding))
+
+                mode = self.writeType.replace('t', '').replace('b', '') + 'b'
+
+                with open(file=target, mode=mode) as jsonFile:
+                    jsonFile.write(payload)
+
+                    if atomic:
+                        jsonFile.flush()
+                        os.fsync(jsonFile.fileno())
+            else:
+                with open(file=target, mode=self.writeType, encoding=self.encoding) as jsonFile:
+                    write(jsonFile)
+
+                    if atomic:
+                        jsonFile.flush()
+                        os.fsync(jsonFile.fileno())
+
+            if atomic:
+                if os.path.exists(path):
+                    shutil.copymode(path, target)
+
+                os.replace(target, path)
 
             return True
-        except PermissionError:
-            raise Exception(f"Error: You do not have permissions to write to '{self.filepath}'.")
-        except Exception as e:
-            raise Exception(f'Unexpected error writing to file: {e}')
+        except PermissionError as e:
+            raise FileError(PERMISSION_ERROR.format(self.filepath)) from e
+        finally:
+            # The temporary file is only left behind when the write failed
+            if atomic:
+                try:
+                    os.remove(target)
+                except FileNotFoundError:
+                    pass
+
+    def iterJson(self, prefix: str = ''):
+        # Yields the (key, value) pairs of the objects at the ijson prefix, so callers
+        # can stop early without the whole document being built for large files
+        try:
+            size = os.path.getsize(self.filepath)
+        except FileNotFoundError as e:
+            raise FileError(FILE_NOT_FOUND_ERROR.format(self.filepath)) from e
+
+        if ijson is None or size < STREAM_THRESHOLD or self.filepath.endswith(COMPRESSED_SUFFIX):
+            for node in _prefixedObjects(self.readJson(), prefix):
+                yield from node.items()
+            return
+
+        try:
+            with open(file=self.filepath, mode='rb') as jsonFile:
+                yield from ijson.kvitems(jsonFile, prefix, use_float=True)
+        except ijson.JSONError as e:
+            raise FileError(MALFORMED_JSON_ERROR) from e
 
     def updateJson(self, newData: dict) -> bool:
+        # dict.update also accepts sequences of pairs, only dictionaries are valid here
+        if not isinstance(newData, dict):
+            raise FileError(INVALID_DATA_ERROR)
+
         try:
             data = self.readJson()
             
             if data is None:
                 return False
 
-            for key, value in newData.items():
-                data[key] = value
+            data.update(newData)
 
             success = self.writeJson(data=data)
             return success
-        except TypeError:
-            raise Exception('Error: The data provided is not a valid dictionary.')
-        except Exception as e:
-            raise Exception(f'Unexpected error updating JSON file: {e}')
+        except TypeError as e:
+            raise FileError(INVALID_DATA_ERROR) from e
 
     def deleteFile(self) -> bool:
-        if os.path.exists(self.filepath):
+        with _JSON_CACHE_LOCK:
+            _JSON_CACHE.pop(os.path.abspath(self.filepath), None)
+
+        # A single unlink, the file may disappear between an exists() check and the removal
+        try:
             os.remove(self.filepath)
             return True
-        
-        return False
+        except FileNotFoundError:
+            return False
 
 class GenericFile:
+    __slots__ = ('filepath', 'readType', 'encoding', 'writeType', '_mmap')
+
     def __init__(self, filepath) -> None:
         self.filepath: str = filepath
         self.readType: str = 'r'
         self.encoding: str = 'utf-8'
         self.writeType: str = 'w'
+        self._mmap: mmap.mmap | None = None
 
     def readFile(self, lines: bool=False) -> str | list | None:
         try:
-            with open(file=self.filepath, mode=self.readType, encoding=self.encoding) as file:
-                return file.read() if not lines else file.readlines()
-        except FileNotFoundError:
-            raise Exception(f"Error: File '{self.filepath}' does not exist.")
-        except Exception as e:
-            raise Exception(f'Unexpected error reading file: {e}')
+            if self.readType != 'r':
+                with open(file=self.filepath, mode=self.readType, encoding=self.encoding) as file:
+                    return file.read() if not lines else file.readlines()
+
+            # The file is decoded in one pass instead of chunk by chunk
+            with open(file=self.filepath, mode='rb') as file:
+                text = file.read().decode(self.encoding)
+
+            # Text mode translates \r\n and \r to \n
+            if '\r' in text:
+                text = text.replace('\r\n', '\n').replace('\r', '\n')
+
+            # StringIO splits on \n only, like readlines, unlike str.splitlines
+            return text if not lines else io.StringIO(text).readlines()
+        except FileNotFoundError as e:
+            raise FileError(FILE_NOT_FOUND_ERROR.format(self.filepath)) from e
+
+    def readBytes(self, zeroCopy: bool=False) -> bytes | memoryview:
+        try:
+            if not zeroCopy:
+                with open(file=self.filepath, mode='rb') as file:
+                    return file.read()
+
+            self.close()
+
+            with open(file=self.filepath, mode='rb') as file:
+                # Empty files cannot be mapped
+                if os.fstat(file.fileno()).st_size == 0:
+                    return memoryview(b'')
+
+                # The map keeps its own handle, pages are loaded by the kernel on access
+                self._mmap = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+
+            return memoryview(self._mmap)
+        except FileNotFoundError as e:
+            raise FileError(FILE_NOT_FOUND_ERROR.format(self.filepath)) from e
+
+    def close(self) -> None:
+        # Views returned by readBytes must be released before the map can be closed
+        if self._mmap is not None:
+            self._mmap.close()
+            self._mmap = None
 
     def writeFile(self, data: str) -> bool:
         try:
-            with open(file=self.filepath, mode=self.writeType, encoding=self.encoding) as file:
-                file.write(data)
+            if self.writeType != 'w':
+                with open(file=self.filepath, mode=self.writeType, encoding=self.encoding) as file:
+                    file.write(data)
+            else:
+                # Text mode translates \n to the platform line separator
+                if os.linesep != '\n':
+                    data = data.replace('\n', os.linesep)
+
+                # The data is encoded once and handed over in a single write
+                with open(file=self.filepath, mode='wb') as file:
+                    file.write(data.encode(self.encoding))
 
             return True
-        except PermissionError:
-            raise Exception(f"Error: You do not have permissions to write to '{self.filepath}'.")
-        except Exception as e:
-            raise Exception(f'Unexpected error writing to file: {e}')
+        except PermissionError as e:
+            raise FileError(PERMISSION_ERROR.format(self.filepath)) from e
 
     def deleteFile(self) -> bool:
-        if os.path.exists(self.filepath):
+        # A single unlink, the file may disappear between an exists() check and the removal
+        try:
             os.remove(self.filepath)
             return True
-        
-        return False
\ No newline at end of file
+        except FileNotFoundError:
+            return False
\ No newline at end of file
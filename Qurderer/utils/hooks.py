@@ -0,0 +1,57 @@
+"""
+This module defines a helper that lets class decorators share a single `__init__` wrapper.
+
+Instead of each decorator wrapping `__init__` in a new closure, decorators register hooks
+that run before or after the original initializer. The constructor arguments are packed
+into `*args`/`**kwargs` and passed on once per instantiation, however many decorators are
+stacked on a class. Each hook is still a call of its own, so stacking does not reduce the
+number of frames.
+"""
+
+from typing import Callable
+
+def addInitHook(cls: type, hook: Callable[[object], None], before: bool = False) -> None:
+    """
+    Registers a hook that runs when an instance of the class is initialized.
+
+    The first hook installs one wrapper around the class `__init__`; later hooks are added
+    to that wrapper. Hooks keep the order nested wrappers would have had: `before` hooks of
+    outer decorators run first, and `after` hooks of inner decorators run first.
+
+    Args:
+        cls (type): The class being decorated.
+        hook (Callable): A function receiving the instance.
+        before (bool, optional): Whether the hook runs before the original initializer.
+            Defaults to False.
+    """
+    init = cls.__dict__.get('__init__')
+
+    if not hasattr(init, 'postHooks'):
+        originalInit = cls.__init__
+        preHooks = []
+        postHooks = []
+
+        def newInit(self, *args, **kwargs):
+            """
+            Initializes the decorated class and runs the registered hooks.
+
+            Args:
+                *args: Positional arguments passed to the original class initializer.
+                **kwargs: Keyword arguments passed to the original class initializer.
+            """
+            for preHook in preHooks:
+                preHook(self)
+
+            originalInit(self, *args, **kwargs)
+
+            for postHook in postHooks:
+                postHook(self)
+
+        newInit.preHooks = preHooks
+        newInit.postHooks = postHooks
+        cls.__init__ = init = newInit
+
+    if before:
+        init.preHooks.insert(0, hook)
+    else:
+        init.postHooks.append(hook)
@@ -0,0 +1,107 @@
+"""
+This module defines helpers that limit how often a callable runs when it is connected
+to a signal that fires in bursts, such as `textChanged` while typing.
+
+`qdebounced` runs the callable once the calls stop for a given timeout, with the last
+arguments received. `qthrottled` runs it at most once per timeout: the first call runs
+immediately and the last call of a burst runs when the timeout expires.
+"""
+
+from typing import Callable
+from PyQt5.QtCore import QTimer
+
+def _singleShotTimer(timeout: int) -> QTimer:
+    """
+    Creates a single-shot timer with the given interval.
+
+    Args:
+        timeout (int): The interval in milliseconds.
+
+    Returns:
+        QTimer: The configured timer.
+    """
+    timer = QTimer()
+    timer.setSingleShot(True)
+    timer.setInterval(timeout)
+    return timer
+
+def qdebounced(function: Callable, timeout: int = 100) -> Callable:
+    """
+    Wraps a callable so it only runs once calls have stopped for `timeout` milliseconds.
+
+    Args:
+        function (Callable): The callable to debounce.
+        timeout (int, optional): The quiet period in milliseconds. Defaults to 100.
+
+    Returns:
+        Callable: A function receiving the same arguments as `function`. The debounced
+            call uses the arguments of the last call.
+    """
+    timer = _singleShotTimer(timeout)
+    pending = []
+
+    def flush():
+        """
+        Runs the callable with the last arguments received.
+        """
+        args = pending.pop()
+        pending.clear()
+        function(*args)
+
+    def debounced(*args):
+        """
+        Stores the arguments and restarts the quiet period.
+        """
+        pending[:] = [args]
+        timer.start()
+
+    timer.timeout.connect(flush)
+
+    # The timer is kept by the wrapper, it lives as long as the connection does
+    debounced.timer = timer
+
+    return debounced
+
+def qthrottled(function: Callable, timeout: int = 100) -> Callable:
+    """
+    Wraps a callable so it runs at most once every `timeout` milliseconds.
+
+    The first call runs immediately. Calls made while the timeout is running are
+    collapsed into a single call with the last arguments, made when it expires.
+
+    Args:
+        function (Callable): The callable to throttle.
+        timeout (int, optional): The minimum interval between calls in milliseconds.
+            Defaults to 100.
+
+    Returns:
+        Callable: A function receiving the same arguments as `function`.
+    """
+    timer = _singleShotTimer(timeout)
+    pending = []
+
+    def flush():
+        """
+        Runs the call collapsed during the timeout, if any, and starts a new one.
+        """
+        if pending:
+            args = pending.pop()
+            function(*args)
+            timer.start()
+
+    def throttled(*args):
+        """
+        Runs the callable now, or defers it to the end of the running timeout.
+        """
+        if timer.isActive():
+            pending[:] = [args]
+        else:
+            function(*args)
+            timer.start()
+
+    timer.timeout.connect(flush)
+
+    # The timer is kept by the wrapper, it lives as long as the connection does
+    throttled.timer = timer
+
+    return throttled
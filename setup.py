@@ -1,17 +1,29 @@
+import os
 from setuptools import setup, find_packages
 
+# The README is read once, relative to this file, and the handle is closed right away
+with open(os.path.join(os.path.dirname(os.path.abspath(__file__)), 'README.md'), encoding='utf-8') as readme:
+    longDescription = readme.read()
+
 setup(
     name="Qurderer",
     version="0.1.0",
     packages=find_packages(),
+    package_data={
+        "Qurderer": ["components/*/*.css", "components/*/icons/*.png"],
+    },
     install_requires=[
         "PyQt5",
         "PyQt5-Qt5",
         "PyQt5_sip",
         "setuptools",
     ],
+    extras_require={
+        "fast": ["orjson", "ijson"],
+        "compression": ["zstandard"],
+    },
     description="Python package designed to simplify the management of PyQt5 applications.",
-    long_description=open('README.md').read(),
+    long_description=longDescription,
     long_description_content_type="text/markdown",
     author="David León",
     author_email="davidalfonsoleoncarmona@gmail.com",
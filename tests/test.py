@@ -1,10 +1,10 @@
 import Qurderer
 import sys
 from PyQt5.QtWidgets import QApplication, QLabel, QVBoxLayout, QWidget, QPushButton, QMainWindow, QHBoxLayout, QLineEdit
-from PyQt5.QtGui import QIcon
-from PyQt5.QtCore import Qt
+from PyQt5.QtCore import Qt, pyqtSlot
 from dataclasses import dataclass
 from Qurderer.stores import useState, Subscribeable
+from Qurderer.utils import qdebounced, qthrottled
 
 # Example of Style
 style = '''
@@ -47,7 +47,10 @@ config = Config()
 # Example of Subscribeable
 counter = Subscribeable(0)
 
-@Qurderer.MainWindow('Main Window', [100, 100, 600, 400], QIcon())
+# Alignment shared by the centered labels
+alignCenter = Qt.AlignCenter
+
+@Qurderer.MainWindow('Main Window', [100, 100, 600, 400])
 @Qurderer.Style(style)
 @Qurderer.UseConfig(config)
 @Qurderer.UseSessionStorage()
@@ -68,8 +71,9 @@ class MyApp(QMainWindow):
         # Set the initial screen
         self.setScreen(mainScreen.name)
 
-        # Create a popup window
-        self.createWindow(PopupWindow(self))
+        # Create a popup window, kept so it can be reopened after being closed
+        self.popupWindow = PopupWindow(self)
+        self.createWindow(self.popupWindow)
         self.createWindow(OtherPopupWindow(self))
 
 @Qurderer.Screen('main')
@@ -81,6 +85,7 @@ class MainScreen(QWidget):
         """Initialize the main screen's UI elements and session storage."""
         super().__init__(parent)
         self.widgetParent = parent
+        self.dialog = None  # Built the first time it is opened
         self.UI(parent)
 
     def UI(self, parent) -> None:
@@ -88,52 +93,43 @@ class MainScreen(QWidget):
 
         # UI elements
         label = QLabel('Main Screen')
-        label.setAlignment(Qt.AlignCenter)
+        label.setAlignment(alignCenter)
 
         # Example of session storage
-        self.SessionStorage.setItem('test<1>', 'hello world!')
-        sessionLabel = QLabel(f"Session data: {self.SessionStorage.getItem('test<1>')}")
-        sessionLabel.setAlignment(Qt.AlignCenter)
+        sessionStorage = self.SessionStorage
+        sessionStorage.setItem('test<1>', 'hello world!')
+        sessionLabel = QLabel(f"Session data: {sessionStorage.getItem('test<1>')}")
+        sessionLabel.setAlignment(alignCenter)
 
         # Example of configuration
         configLabel = QLabel(f'Configuration data: {self.Config.message}')
-        configLabel.setAlignment(Qt.AlignCenter)
+        configLabel.setAlignment(alignCenter)
 
         # Button to show a notification
         buttonNotify = QPushButton('Show Notification')
-        buttonNotify.clicked.connect(lambda: Qurderer.components.Notify('This is a notification!', 3000, parent))
+        buttonNotify.clicked.connect(self.showNotification)
 
         # Button to navigate to another screen
         buttonNavigate = QPushButton('Go to Other Screen')
-        buttonNavigate.clicked.connect(lambda: parent.setScreen('other'))
+        buttonNavigate.clicked.connect(self.goToOther)
         
         # Button to navigate to store screen
         buttonStore = QPushButton('Go to Store Screen')
-        buttonStore.clicked.connect(lambda: parent.setScreen('store'))
+        buttonStore.clicked.connect(self.goToStore)
 
         # Button to open a popup window
         buttonPopup = QPushButton('Open Popup')
-        buttonPopup.clicked.connect(lambda: parent.createWindow(PopupWindow(parent)))
+        buttonPopup.clicked.connect(self.openPopup)
 
         buttonClosePopup = QPushButton('Close Popup')
-        buttonClosePopup.clicked.connect(lambda: parent.closeWindow(PopupWindow(parent).name))
+        buttonClosePopup.clicked.connect(self.closePopup)
 
         # Dialog example
-        dialogLayout = QVBoxLayout()
-        dialogLayout.addWidget(QLabel('Hello in dialog.'))
-
-        dialog = Qurderer.components.Dialog(parent, dialogLayout)
-
-        buttonDialog = QPushButton('Close Dialog')
-        buttonDialog.clicked.connect(dialog.close)
-
-        dialog.addWidget(buttonDialog)
-
         buttonOpenDialog = QPushButton('Open Dialog')
-        buttonOpenDialog.clicked.connect(dialog.show)
+        buttonOpenDialog.clicked.connect(self.openDialog)
 
         buttonSetSessionData = QPushButton('Set test<2>')
-        buttonSetSessionData.clicked.connect(lambda: self.SessionStorage.setItem('test<2>', 'hello world!'))
+        buttonSetSessionData.clicked.connect(self.setSessionData)
         
         # Add widgets to the layout
         layout.addWidget(label)
@@ -150,7 +146,54 @@ class MainScreen(QWidget):
         # Set the layout
         self.setLayout(layout)
 
-@Qurderer.Screen('other', autoreloadUI=True)
+    @pyqtSlot()
+    def showNotification(self):
+        """Show a notification."""
+        Qurderer.components.Notify('This is a notification!', 3000, self.widgetParent)
+
+    @pyqtSlot()
+    def goToOther(self):
+        """Navigate to the other screen."""
+        self.widgetParent.setScreen('other')
+
+    @pyqtSlot()
+    def goToStore(self):
+        """Navigate to the store screen."""
+        self.widgetParent.setScreen('store')
+
+    @pyqtSlot()
+    def openPopup(self):
+        """Open the popup window."""
+        self.widgetParent.createWindow(self.widgetParent.popupWindow)
+
+    @pyqtSlot()
+    def closePopup(self):
+        """Close the popup window."""
+        # The window name is a class attribute, no instance is needed to read it
+        self.widgetParent.closeWindow(PopupWindow.name)
+
+    @pyqtSlot()
+    def openDialog(self):
+        """Open the dialog, building it on first use."""
+        if self.dialog is None:
+            dialogLayout = QVBoxLayout()
+            dialogLayout.addWidget(QLabel('Hello in dialog.'))
+
+            self.dialog = Qurderer.components.Dialog(self.widgetParent, dialogLayout)
+
+            buttonDialog = QPushButton('Close Dialog')
+            buttonDialog.clicked.connect(self.dialog.close)
+
+            self.dialog.addWidget(buttonDialog)
+
+        self.dialog.show()
+
+    @pyqtSlot()
+    def setSessionData(self):
+        """Store test<2> in the session storage."""
+        self.SessionStorage.setItem('test<2>', 'hello world!')
+
+@Qurderer.Screen('other')
 @Qurderer.UseSessionStorage()
 class OtherScreen(QWidget):
     """Secondary screen with session storage and navigation."""
@@ -165,30 +208,32 @@ class OtherScreen(QWidget):
 
         # UI elements
         label = QLabel('Other Screen')
-        label.setAlignment(Qt.AlignCenter)
+        label.setAlignment(alignCenter)
 
-        # Example of session storage
-        sessionLabel = QLabel(f"Session data test<1>: {self.SessionStorage.getItem('test<1>')}")
-        sessionLabel.setAlignment(Qt.AlignCenter)
+        # Example of session storage, refreshed on show instead of rebuilding the UI
+        self.sessionLabel = QLabel()
+        self.sessionLabel.setAlignment(alignCenter)
 
-        sessionTestReload = QLabel(f"Session data test<2>: {self.SessionStorage.getItem('test<2>')}")
-        sessionTestReload.setAlignment(Qt.AlignCenter)
+        self.sessionTestReload = QLabel()
+        self.sessionTestReload.setAlignment(alignCenter)
 
-        buttonReloadUI = QPushButton('Reload UI')
-        buttonReloadUI.clicked.connect(self.reloadUI)
+        self.refreshSessionData()
+
+        buttonReloadUI = QPushButton('Reload Session Data')
+        buttonReloadUI.clicked.connect(self.refreshSessionData)
 
         # Button to navigate back to the main screen
         buttonBack = QPushButton('Go Back to Main Screen')
-        buttonBack.clicked.connect(lambda: parent.setScreen('main'))
+        buttonBack.clicked.connect(self.goToMain)
         
         # Button to navigate to store screen
         buttonStore = QPushButton('Go to Store Screen')
-        buttonStore.clicked.connect(lambda: parent.setScreen('store'))
+        buttonStore.clicked.connect(self.goToStore)
 
         # Add widgets to the layout
         layout.addWidget(label)
-        layout.addWidget(sessionLabel)
-        layout.addWidget(sessionTestReload)
+        layout.addWidget(self.sessionLabel)
+        layout.addWidget(self.sessionTestReload)
         layout.addWidget(buttonBack)
         layout.addWidget(buttonStore)
         layout.addWidget(buttonReloadUI)
@@ -196,6 +241,28 @@ class OtherScreen(QWidget):
         # Set the layout
         self.setLayout(layout)
 
+    def showEvent(self, event):
+        """Refresh the session data each time the screen is shown."""
+        self.refreshSessionData()
+        super().showEvent(event)
+
+    @pyqtSlot()
+    def refreshSessionData(self):
+        """Update the session data labels without rebuilding the UI."""
+        sessionStorage = self.SessionStorage
+        self.sessionLabel.setText(f"Session data test<1>: {sessionStorage.getItem('test<1>')}")
+        self.sessionTestReload.setText(f"Session data test<2>: {sessionStorage.getItem('test<2>')}")
+
+    @pyqtSlot()
+    def goToMain(self):
+        """Navigate back to the main screen."""
+        self.widgetParent.setScreen('main')
+
+    @pyqtSlot()
+    def goToStore(self):
+        """Navigate to the store screen."""
+        self.widgetParent.setScreen('store')
+
 @Qurderer.Screen('store')
 class StoreScreen(QWidget):
     """Screen demonstrating the use of useState and Subscribeable."""
@@ -207,7 +274,13 @@ class StoreScreen(QWidget):
         # Create useState examples
         self.count, self.setCount, self.subscribeCount = useState(0)
         self.text, self.setText, self.subscribeText = useState("Hello from useState!")
+
+        # Typing stores the text once the input pauses, not on every keystroke
+        self.setTextDebounced = qdebounced(self.setText, 50)
         
+        # Labels follow every change, rapid clicks show one notification per burst
+        self.notifyThrottled = qthrottled(self.notify, 500)
+
         # Subscribe to counter changes
         counter.subscribe(self.onCounterChange)
         
@@ -217,11 +290,6 @@ class StoreScreen(QWidget):
         # Subscribe to state changes
         self.subscribeCount(self.onCountChange)
         self.subscribeText(self.onTextChange)
-        
-        # Update UI with initial values
-        self.countLabel.setText(f"Count: {self.count()}")
-        self.textLabel.setText(f"Text: {self.text()}")
-        self.counterLabel.setText(f"Counter: {counter.value}")
 
     def UI(self, parent) -> None:
         """Set up the user interface for the store screen."""
@@ -229,13 +297,13 @@ class StoreScreen(QWidget):
         
         # Title
         title = QLabel('Store Examples')
-        title.setAlignment(Qt.AlignCenter)
+        title.setAlignment(alignCenter)
         mainLayout.addWidget(title)
         
         # useState example section
         useStateSection = QVBoxLayout()
         useStateTitle = QLabel('useState Example')
-        useStateTitle.setAlignment(Qt.AlignCenter)
+        useStateTitle.setAlignment(alignCenter)
         useStateSection.addWidget(useStateTitle)
         
         # Count example
@@ -251,7 +319,7 @@ class StoreScreen(QWidget):
         textLayout = QHBoxLayout()
         self.textLabel = QLabel(f"Text: {self.text()}")
         textInput = QLineEdit(self.text())
-        textInput.textChanged.connect(self.setText)
+        textInput.textChanged.connect(self.onTextInput)
         textLayout.addWidget(self.textLabel)
         textLayout.addWidget(textInput)
         useStateSection.addLayout(textLayout)
@@ -261,7 +329,7 @@ class StoreScreen(QWidget):
         # Subscribeable example section
         subscribeableSection = QVBoxLayout()
         subscribeableTitle = QLabel('Subscribeable Example')
-        subscribeableTitle.setAlignment(Qt.AlignCenter)
+        subscribeableTitle.setAlignment(alignCenter)
         subscribeableSection.addWidget(subscribeableTitle)
         
         # Counter example
@@ -278,9 +346,9 @@ class StoreScreen(QWidget):
         # Navigation buttons
         navLayout = QHBoxLayout()
         buttonBack = QPushButton('Go Back to Main Screen')
-        buttonBack.clicked.connect(lambda: parent.setScreen('main'))
+        buttonBack.clicked.connect(self.goToMain)
         buttonOther = QPushButton('Go to Other Screen')
-        buttonOther.clicked.connect(lambda: parent.setScreen('other'))
+        buttonOther.clicked.connect(self.goToOther)
         navLayout.addWidget(buttonBack)
         navLayout.addWidget(buttonOther)
         mainLayout.addLayout(navLayout)
@@ -288,29 +356,53 @@ class StoreScreen(QWidget):
         # Set the layout
         self.setLayout(mainLayout)
     
+    @pyqtSlot()
+    def goToMain(self):
+        """Navigate back to the main screen."""
+        self.widgetParent.setScreen('main')
+
+    @pyqtSlot()
+    def goToOther(self):
+        """Navigate to the other screen."""
+        self.widgetParent.setScreen('other')
+
+    @pyqtSlot()
     def incrementCount(self):
         """Increment the count state."""
         self.setCount(self.count() + 1)
     
+    @pyqtSlot()
     def incrementCounter(self):
         """Increment the counter Subscribeable."""
-        counter.value = counter.value + 1
+        counter.update(lambda value: value + 1)
     
+    @pyqtSlot(str)
+    def onTextInput(self, text):
+        """Store the text typed in the input."""
+        self.setTextDebounced(text)
+
+    @pyqtSlot(int)
     def onCountChange(self, newValue):
         """Handle count state changes."""
         self.countLabel.setText(f"Count: {newValue}")
-        Qurderer.components.Notify(f"Count changed to {newValue}", 1000, self.widgetParent)
+        self.notifyThrottled(f"Count changed to {newValue}")
     
+    @pyqtSlot(str)
     def onTextChange(self, newValue):
         """Handle text state changes."""
         self.textLabel.setText(f"Text: {newValue}")
     
+    @pyqtSlot(int)
     def onCounterChange(self, newValue):
         """Handle counter Subscribeable changes."""
         self.counterLabel.setText(f"Counter: {newValue}")
-        Qurderer.components.Notify(f"Counter changed to {newValue}", 1000, self.widgetParent)
+        self.notifyThrottled(f"Counter changed to {newValue}")
+
+    def notify(self, message):
+        """Show a short notification."""
+        Qurderer.components.Notify(message, 1000, self.widgetParent)
 
-@Qurderer.Window('popup', 'Popup Window', [710, 100, 400, 150], QIcon(), resizable=False)
+@Qurderer.Window('popup', 'Popup Window', [710, 100, 400, 150], resizable=False)
 @Qurderer.UseSessionStorage()
 class PopupWindow(QMainWindow):
     """Popup window with screen management and session storage."""
@@ -324,6 +416,7 @@ class PopupWindow(QMainWindow):
         self.addScreen(self.mainScreen)
         self.setScreen(self.mainScreen.name)
 
+    @pyqtSlot()
     def closePopup(self):
         """Close the popup window."""
         self.mainWindow.closeWindow(self.name)
@@ -345,7 +438,7 @@ class PopupMainScreen(QWidget):
 
         # UI elements
         label = QLabel('This is a popup window')
-        label.setAlignment(Qt.AlignCenter)
+        label.setAlignment(alignCenter)
 
         # Button to close the popup window
         buttonClose = QPushButton('Close Popup')
@@ -367,12 +460,13 @@ class PopupMainScreen(QWidget):
         # Set the layout
         self.setLayout(mainLayout)
 
+    @pyqtSlot()
     def showSessionData(self):
         """Show session data in a notification."""
         value = self.SessionStorage.getItem('test<1>')
         Qurderer.components.Notify(f'Session data: {value}', 3000, self.widgetParent)
 
-@Qurderer.Window('otherpopup', 'Other Popup Window', [710, 285, 400, 150], QIcon(), resizable=False)
+@Qurderer.Window('otherpopup', 'Other Popup Window', [710, 285, 400, 150], resizable=False)
 @Qurderer.UseSessionStorage()
 class OtherPopupWindow(QMainWindow):
     """Popup window with screen management."""
@@ -386,6 +480,7 @@ class OtherPopupWindow(QMainWindow):
         self.addScreen(self.mainScreen)
         self.setScreen(self.mainScreen.name)
 
+    @pyqtSlot()
     def closePopup(self):
         """Close the popup window."""
         self.mainWindow.closeWindow(self.name)
@@ -407,7 +502,7 @@ class OtherNoneScreen(QWidget):
 
         # UI elements
         label = QLabel('Other-none Screen')
-        label.setAlignment(Qt.AlignCenter)
+        label.setAlignment(alignCenter)
 
         buttonReloadUI = QPushButton('Reload UI')
         buttonReloadUI.clicked.connect(self.reloadUI)
@@ -0,0 +1,317 @@
+import json
+import re
+import sys
+from pathlib import Path
+
+import pytest
+
+from Qurderer.utils import files
+
+NESTED = {'items': [{'a': 1}, {'b': 2}, 3], 'item': {'c': 4}, 'x': 5}
+TOP_ARRAY = [{'a': 1}, {'b': [{'c': 2}]}]
+
+@pytest.fixture(params=['parsed', 'streamed'])
+def iterMode(request, monkeypatch):
+    # 'streamed' forces the ijson path, 'parsed' the fallback on the whole document
+    if request.param == 'streamed':
+        if files.ijson is None:
+            pytest.skip('ijson is not installed')
+        monkeypatch.setattr(files, 'STREAM_THRESHOLD', 0)
+    else:
+        monkeypatch.setattr(files, 'ijson', None)
+
+    return request.param
+
+def writeJsonFile(path: Path, data) -> str:
+    path.write_text(json.dumps(data), encoding='utf-8')
+    return str(path)
+
+@pytest.mark.parametrize('prefix, expected', [
+    ('', [('items', NESTED['items']), ('item', {'c': 4}), ('x', 5)]),
+    ('items.item', [('a', 1), ('b', 2)]),
+    ('item', [('c', 4)]),
+    ('items', []),
+    ('x', []),
+    ('missing', []),
+])
+def test_iterJson_object_prefixes(tmp_path, iterMode, prefix, expected):
+    path = writeJsonFile(tmp_path / 'data.json', NESTED)
+
+    assert list(files.JsonFile(path).iterJson(prefix)) == expected
+
+@pytest.mark.parametrize('prefix, expected', [
+    ('', []),
+    ('item', [('a', 1), ('b', [{'c': 2}])]),
+    ('item.b.item', [('c', 2)]),
+])
+def test_iterJson_top_level_array(tmp_path, iterMode, prefix, expected):
+    path = writeJsonFile(tmp_path / 'data.json', TOP_ARRAY)
+
+    assert list(files.JsonFile(path).iterJson(prefix)) == expected
+
+def test_readJsonMany_shares_the_cache_across_threads(tmp_path, monkeypatch):
+    # More files than cache slots, so the worker threads evict each other's entries
+    monkeypatch.setattr(files, 'JSON_CACHE_SIZE', 4)
+    paths = [writeJsonFile(tmp_path / f'{index}.json', {'index': index}) for index in range(32)]
+    expected = {path: {'index': index} for index, path in enumerate(paths)}
+
+    # Switching threads as often as possible makes interleaved cache updates likely
+    switchInterval = sys.getswitchinterval()
+    sys.setswitchinterval(1e-6)
+
+    try:
+        for _ in range(20):
+            assert files.JsonFile.readJsonMany(paths + paths) == expected
+    finally:
+        sys.setswitchinterval(switchInterval)
+
+    assert len(files._JSON_CACHE) <= 4
+
+def test_writeJson_replaces_the_file(tmp_path):
+    path = writeJsonFile(tmp_path / 'data.json', {'old': True})
+
+    assert files.JsonFile(path).writeJson({'new': True})
+    assert json.loads(Path(path).read_text(encoding='utf-8')) == {'new': True}
+    # No temporary file is left next to the document
+    assert sorted(tmp_path.iterdir()) == [Path(path)]
+
+def test_writeJson_exclusive_mode_keeps_an_existing_file(tmp_path):
+    path = writeJsonFile(tmp_path / 'data.json', {'old': True})
+    jsonFile = files.JsonFile(path)
+    jsonFile.writeType = 'x'
+
+    with pytest.raises(FileExistsError):
+        jsonFile.writeJson({'new': True})
+
+    assert json.loads(Path(path).read_text(encoding='utf-8')) == {'old': True}
+
+    created = files.JsonFile(str(tmp_path / 'created.json'))
+    created.writeType = 'x'
+
+    assert created.writeJson({'new': True})
+    assert created.readJson() == {'new': True}
+
+def test_writeJson_append_mode_writes_after_the_content(tmp_path):
+    path = tmp_path / 'data.jsonl'
+    path.write_text('{"a": 1}\n', encoding='utf-8')
+    jsonFile = files.JsonFile(str(path))
+    jsonFile.writeType = 'a'
+
+    assert jsonFile.writeJson({'b': 2})
+    assert path.read_text(encoding='utf-8') == '{"a": 1}\n' + json.dumps({'b': 2}, indent=4)
+
+@pytest.mark.skipif(not hasattr(files.os, 'symlink'), reason='symlinks are not supported')
+def test_writeJson_through_a_symlink_replaces_its_target(tmp_path):
+    target = Path(writeJsonFile(tmp_path / 'target.json', {'old': True}))
+    link = tmp_path / 'link.json'
+
+    try:
+        link.symlink_to(target)
+    except OSError:
+        pytest.skip('symlinks cannot be created here')
+
+    assert files.JsonFile(str(link)).writeJson({'new': True})
+    assert link.is_symlink()
+    assert json.loads(target.read_text(encoding='utf-8')) == {'new': True}
+
+SPECIAL = {'a': 1, 'text': 'ñandú', 'nan': float('nan'), 'big': 2 ** 70, 'nested': [1.5, None, True]}
+
+@pytest.mark.parametrize('indent', [None, 2, 4])
+def test_writeJson_matches_the_json_module(tmp_path, indent):
+    jsonFile = files.JsonFile(str(tmp_path / 'data.json'))
+    jsonFile.indent = indent
+
+    assert jsonFile.writeJson(SPECIAL)
+    assert (tmp_path / 'data.json').read_text(encoding='utf-8') == json.dumps(SPECIAL, indent=indent)
+
+def test_readJson_accepts_what_the_json_module_accepts(tmp_path):
+    path = tmp_path / 'data.json'
+    path.write_text(json.dumps(SPECIAL), encoding='utf-8')
+    data = files.JsonFile(str(path)).readJson()
+
+    assert data['nan'] != data['nan']
+    assert {key: value for key, value in data.items() if key != 'nan'} == {
+        key: value for key, value in SPECIAL.items() if key != 'nan'
+    }
+
+@pytest.mark.parametrize('newData', [[('w', 1)], 'w', None])
+def test_updateJson_rejects_data_that_is_not_a_dictionary(tmp_path, newData):
+    path = writeJsonFile(tmp_path / 'data.json', {'a': 1})
+
+    with pytest.raises(files.FileError, match='not a valid dictionary'):
+        files.JsonFile(path).updateJson(newData)
+
+    assert files.JsonFile(path).readJson() == {'a': 1}
+
+def test_updateJson_merges_the_new_keys(tmp_path):
+    path = writeJsonFile(tmp_path / 'data.json', {'a': 1, 'b': 2})
+
+    assert files.JsonFile(path).updateJson({'b': 3, 'c': 4})
+    assert files.JsonFile(path).readJson() == {'a': 1, 'b': 3, 'c': 4}
+
+def test_readBytes_maps_the_file_until_closed(tmp_path):
+    path = tmp_path / 'data.bin'
+    path.write_bytes(b'\x00payload')
+    genericFile = files.GenericFile(str(path))
+
+    assert genericFile.readBytes() == b'\x00payload'
+
+    view = genericFile.readBytes(zeroCopy=True)
+
+    assert isinstance(view, memoryview)
+    assert view.tobytes() == b'\x00payload'
+
+    # The map cannot be closed while a view of it is alive
+    view.release()
+    genericFile.close()
+    genericFile.close()
+
+    assert genericFile._mmap is None
+
+def test_readBytes_of_an_empty_file(tmp_path):
+    path = tmp_path / 'empty.bin'
+    path.write_bytes(b'')
+    genericFile = files.GenericFile(str(path))
+
+    assert genericFile.readBytes(zeroCopy=True).tobytes() == b''
+    genericFile.close()
+
+def test_readJson_returns_independent_copies_and_sees_changes(tmp_path):
+    jsonFile = files.JsonFile(writeJsonFile(tmp_path / 'data.json', {'a': [1]}))
+
+    first = jsonFile.readJson()
+    first['a'].append(2)
+
+    assert jsonFile.readJson() == {'a': [1]}
+
+    assert jsonFile.writeJson({'a': [3]})
+    assert jsonFile.readJson() == {'a': [3]}
+
+def test_readFile_translates_line_endings(tmp_path):
+    path = tmp_path / 'data.txt'
+    path.write_bytes(b'a\r\nb\rc\n')
+    genericFile = files.GenericFile(str(path))
+
+    assert genericFile.readFile() == 'a\nb\nc\n'
+    assert genericFile.readFile(lines=True) == ['a\n', 'b\n', 'c\n']
+
+def test_readJsonMany_returns_every_path(tmp_path):
+    paths = [writeJsonFile(tmp_path / f'{index}.json', {'index': index}) for index in range(3)]
+
+    assert files.JsonFile.readJsonMany([]) == {}
+    assert files.JsonFile.readJsonMany(paths[:1]) == {paths[0]: {'index': 0}}
+    assert files.JsonFile.readJsonMany(paths) == {path: {'index': index} for index, path in enumerate(paths)}
+
+@pytest.mark.parametrize('top, items, expected', [
+    ('array', iter([1, {'a': 'ñ'}, [None]]), [1, {'a': 'ñ'}, [None]]),
+    ('array', iter([]), []),
+    ('object', iter([('a', 1), (2, [True])]), {'a': 1, '2': [True]}),
+    ('object', iter([]), {}),
+])
+def test_writeJsonStreaming_writes_a_valid_document(tmp_path, top, items, expected):
+    path = tmp_path / 'data.json'
+
+    assert files.JsonFile(str(path)).writeJsonStreaming(items, top)
+    assert json.loads(path.read_text(encoding='utf-8')) == expected
+
+def test_writeJsonStreaming_rejects_unknown_top_level_types(tmp_path):
+    with pytest.raises(files.FileError, match="Unknown top-level type 'tuple'"):
+        files.JsonFile(str(tmp_path / 'data.json')).writeJsonStreaming([], 'tuple')
+
+    assert not (tmp_path / 'data.json').exists()
+
+def test_deleteFile_reports_whether_a_file_was_removed(tmp_path):
+    path = writeJsonFile(tmp_path / 'data.json', {'a': 1})
+
+    assert files.JsonFile(path).readJson() == {'a': 1}
+    assert files.JsonFile(path).deleteFile()
+    assert not files.JsonFile(path).deleteFile()
+
+    with pytest.raises(files.FileError):
+        files.JsonFile(path).readJson()
+
+    Path(path).write_text('text', encoding='utf-8')
+
+    assert files.GenericFile(path).deleteFile()
+    assert not files.GenericFile(path).deleteFile()
+
+def test_compressed_files_round_trip(tmp_path):
+    zstandard = pytest.importorskip('zstandard')
+    path = tmp_path / 'data.json.zst'
+    jsonFile = files.JsonFile(str(path))
+
+    assert jsonFile.writeJson({'a': 1, 'b': [1, 2]})
+    assert json.loads(zstandard.ZstdDecompressor().decompress(path.read_bytes())) == {'a': 1, 'b': [1, 2]}
+    assert jsonFile.readJson() == {'a': 1, 'b': [1, 2]}
+    assert list(jsonFile.iterJson('')) == [('a', 1), ('b', [1, 2])]
+
+    assert jsonFile.writeJsonStreaming(iter([('c', 3)]), 'object')
+    assert jsonFile.readJson() == {'c': 3}
+
+def test_compressed_files_require_zstandard(tmp_path, monkeypatch):
+    monkeypatch.setattr(files, 'zstandard', None)
+    path = str(tmp_path / 'data.json.zst')
+
+    with pytest.raises(files.FileError, match='requires the zstandard package'):
+        files.JsonFile(path).writeJson({'a': 1})
+
+    Path(path).write_bytes(b'')
+
+    with pytest.raises(files.FileError, match='requires the zstandard package'):
+        files.JsonFile(path).readJson()
+
+def test_missing_files_raise_file_errors(tmp_path):
+    path = str(tmp_path / 'missing.json')
+    message = f"Error: File '{path}' does not exist."
+
+    with pytest.raises(files.FileError, match=re.escape(message)):
+        files.JsonFile(path).readJson()
+
+    with pytest.raises(files.FileError, match=re.escape(message)):
+        next(files.JsonFile(path).iterJson())
+
+    with pytest.raises(files.FileError, match=re.escape(message)):
+        files.GenericFile(path).readFile()
+
+    with pytest.raises(files.FileError, match=re.escape(message)):
+        files.GenericFile(path).readBytes()
+
+def test_malformed_json_raises_a_file_error(tmp_path):
+    path = tmp_path / 'data.json'
+    path.write_text('{"a": ', encoding='utf-8')
+
+    with pytest.raises(files.FileError, match='Error: File contains malformed JSON.'):
+        files.JsonFile(str(path)).readJson()
+
+def test_file_errors_are_exceptions():
+    # Existing `except Exception` handlers keep catching them
+    assert issubclass(files.FileError, Exception)
+
+def test_writeJson_read_write_mode_writes_in_place(tmp_path):
+    path = tmp_path / 'data.json'
+    path.write_text('{"a": 1}', encoding='utf-8')
+    jsonFile = files.JsonFile(str(path))
+    jsonFile.writeType = 'r+'
+    jsonFile.indent = None
+
+    assert jsonFile.writeJson({'b': 2})
+    assert path.read_text(encoding='utf-8') == '{"b": 2}'
+    assert sorted(tmp_path.iterdir()) == [path]
+
+    missing = files.JsonFile(str(tmp_path / 'missing.json'))
+    missing.writeType = 'r+'
+
+    # 'r+' never creates the file, like open() itself
+    with pytest.raises(FileNotFoundError):
+        missing.writeJson({'b': 2})
+
+def test_compressed_files_cannot_be_appended_to(tmp_path):
+    path = tmp_path / 'data.json.zst'
+    path.write_bytes(b'frame')
+    jsonFile = files.JsonFile(str(path))
+    jsonFile.writeType = 'a'
+
+    with pytest.raises(files.FileError, match='cannot be appended to'):
+        jsonFile.writeJson({'a': 1})
+
+    assert path.read_bytes() == b'frame'
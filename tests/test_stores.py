@@ -0,0 +1,158 @@
+import gc
+from dataclasses import dataclass, field
+
+import pytest
+
+from Qurderer.stores import State, Subscribeable, useState
+
+@dataclass
+class Listener:
+    # A plain dataclass compares by value and is unhashable
+    name: str
+    received: list = field(default_factory=list)
+
+    def on(self, value):
+        self.received.append(value)
+
+@dataclass(eq=True, frozen=True)
+class HashableListener:
+    name: str
+    received: list = field(default_factory=list, compare=False, hash=False)
+
+    def on(self, value):
+        self.received.append(value)
+
+class SlottedListener:
+    # No __weakref__ slot, so its methods cannot be held weakly
+    __slots__ = ('received',)
+
+    def __init__(self):
+        self.received = []
+
+    def on(self, value):
+        self.received.append(value)
+
+def setValue(store, value):
+    if isinstance(store, State):
+        store.set(value)
+    else:
+        store.value = value
+
+@pytest.fixture(params=[State, Subscribeable])
+def store(request):
+    return request.param(0)
+
+def test_subscribers_receive_changes_once(store):
+    received = []
+    callback = received.append
+
+    store.subscribe(callback)
+    store.subscribe(callback)
+    setValue(store, 1)
+    setValue(store, 1)
+
+    assert received == [1]
+
+def test_unsubscribe_stops_notifications(store):
+    listener = Listener('a')
+    received = []
+    callback = received.append
+
+    store.subscribe(listener.on)
+    store.subscribe(callback)
+    setValue(store, 1)
+    store.unsubscribe(listener.on)
+    store.unsubscribe(callback)
+    store.unsubscribe(callback)
+    setValue(store, 2)
+
+    assert listener.received == [1]
+    assert received == [1]
+    assert not store._callbacks
+
+def test_collected_owners_are_pruned(store):
+    kept = Listener('kept')
+    dropped = Listener('dropped')
+
+    store.subscribe(kept.on)
+    store.subscribe(dropped.on)
+    del dropped
+    gc.collect()
+    setValue(store, 1)
+
+    assert kept.received == [1]
+    assert len(store._callbacks) == 1
+
+def test_methods_of_unhashable_owners_can_subscribe(store):
+    listener = Listener('a')
+
+    store.subscribe(listener.on)
+    setValue(store, 1)
+    store.unsubscribe(listener.on)
+    setValue(store, 2)
+
+    assert listener.received == [1]
+
+@pytest.mark.parametrize('listenerType', [Listener, HashableListener])
+def test_equal_owners_are_separate_subscribers(store, listenerType):
+    first = listenerType('same')
+    second = listenerType('same')
+
+    assert first == second
+
+    store.subscribe(first.on)
+    store.subscribe(second.on)
+    setValue(store, 5)
+
+    assert first.received == [5]
+    assert second.received == [5]
+
+    store.unsubscribe(first.on)
+    setValue(store, 6)
+
+    assert first.received == [5]
+    assert second.received == [5, 6]
+
+def test_methods_of_unweakrefable_owners_are_held_strongly(store):
+    listener = SlottedListener()
+    received = listener.received
+
+    store.subscribe(listener.on)
+    del listener
+    gc.collect()
+    setValue(store, 1)
+
+    assert received == [1]
+
+def test_a_failing_subscriber_does_not_stop_the_others(store, capsys):
+    received = []
+
+    store.subscribe(lambda value: 1 / 0)
+    store.subscribe(received.append)
+    setValue(store, 1)
+
+    assert received == [1]
+    assert 'division by zero' in capsys.readouterr().out
+
+def test_subscribers_can_unsubscribe_while_notified(store):
+    received = []
+
+    def once(value):
+        received.append(value)
+        store.unsubscribe(once)
+
+    store.subscribe(once)
+    setValue(store, 1)
+    setValue(store, 2)
+
+    assert received == [1]
+
+def test_useState_handle():
+    get, set, subscribe = handle = useState(0)
+    received = []
+
+    subscribe(received.append)
+    set(1)
+
+    assert get() == handle.get() == 1
+    assert received == [1]